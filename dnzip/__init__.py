@@ -21,11 +21,37 @@ This library provides a pure Python implementation for reading and writing
 standard ZIP and ZIP64 archives, using only Python standard library modules.
 """
 
-from .reader import ZipReader
-from .writer import ZipWriter
-from .stream import StreamingZipWriter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .reader import ZipReader
+    from .stream import StreamingZipWriter
+    from .writer import ZipWriter
 
 __all__ = ["ZipReader", "ZipWriter", "StreamingZipWriter"]
 
 __version__ = "0.1.2"
 
+# Public classes are imported on first access so that ``import dnzip`` (and
+# ``python -m dnzip --version``) does not pay for the compression/CRC modules.
+_LAZY_IMPORTS = {
+    "ZipReader": ".reader",
+    "ZipWriter": ".writer",
+    "StreamingZipWriter": ".stream",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
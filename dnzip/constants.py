@@ -29,17 +29,30 @@ ZIP64_END_OF_CENTRAL_DIR = 0x06064B50  # "PK\x06\x06"
 ZIP64_END_OF_CENTRAL_DIR_LOCATOR = 0x07064B50  # "PK\x06\x07"
 DATA_DESCRIPTOR = 0x08074B50  # "PK\x07\x08"
 
+# Signatures of the other formats recognized by utils.detect_archive_format()
+GZIP_MAGIC_NUMBER = 0x1F8B  # Big-endian first two bytes
+BZIP2_MAGIC_NUMBER = b"BZ"
+XZ_MAGIC_NUMBER = b"\xfd7zXZ\x00"
+SEVENZ_MAGIC_NUMBER = b"7z\xbc\xaf\x27\x1c"
+RAR_MAGIC_V4 = b"Rar!\x1a\x07\x00"  # RAR 1.5 - 4.x
+RAR_MAGIC_V4_OLD = b"RE\x7e\x5e"  # RAR before 1.5
+RAR_MAGIC_V5 = b"Rar!\x1a\x07\x01\x00"
+TAR_MAGIC_USTAR = b"ustar"  # At offset 257 of the first header block
+TAR_MAGIC_GNU = b"ustar "  # GNU tar: "ustar  \0"
+
 # Compression methods
 COMP_STORED = 0  # No compression
 COMP_DEFLATE = 8  # Deflate compression (zlib)
 COMP_BZIP2 = 12  # BZIP2 compression
 COMP_LZMA = 14  # LZMA compression
+COMP_ZSTD = 93  # Zstandard compression (APPNOTE 6.3.7)
 
 # Compression method names (for API)
 COMPRESSION_STORED = "stored"
 COMPRESSION_DEFLATE = "deflate"
 COMPRESSION_BZIP2 = "bzip2"
 COMPRESSION_LZMA = "lzma"
+COMPRESSION_ZSTD = "zstd"
 
 # Compression method mapping
 COMPRESSION_METHODS = {
@@ -47,6 +60,7 @@ COMPRESSION_METHODS = {
     COMPRESSION_DEFLATE: COMP_DEFLATE,
     COMPRESSION_BZIP2: COMP_BZIP2,
     COMPRESSION_LZMA: COMP_LZMA,
+    COMPRESSION_ZSTD: COMP_ZSTD,
 }
 
 # Reverse mapping
@@ -55,6 +69,7 @@ METHOD_TO_NAME = {
     COMP_DEFLATE: COMPRESSION_DEFLATE,
     COMP_BZIP2: COMPRESSION_BZIP2,
     COMP_LZMA: COMPRESSION_LZMA,
+    COMP_ZSTD: COMPRESSION_ZSTD,
 }
 
 # General purpose bit flags
@@ -98,3 +113,10 @@ DATA_DESCRIPTOR_SIZE = 12
 # ZIP64 data descriptor size
 ZIP64_DATA_DESCRIPTOR_SIZE = 20
 
+
+# Chunk size used when streaming entry data into or out of an archive
+COPY_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+
+# Slice of a copy buffer that is CRC'd and compressed back to back, small
+# enough to still be in L2 cache when the compressor reads it
+FUSED_SLICE_SIZE = 128 * 1024  # 128 KiB
@@ -0,0 +1,81 @@
+"""
+Copyright 2025 DNAi inc.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+"""
+Terminal progress reporting for the command-line interface.
+
+The extract and create commands report progress through a callback taking
+``(entry_name, bytes_done, entry_size)``; this module builds one that redraws a
+single status line on stderr.
+"""
+
+import sys
+import time
+from typing import Callable, Optional, TextIO
+
+# (entry name, bytes done, entry size) -> None
+ProgressCallback = Callable[[str, int, int], None]
+
+# The status line is redrawn at most this often (seconds)
+PROGRESS_MIN_INTERVAL = 1 / 30
+
+
+def create_progress_callback(
+    total_files: int,
+    quiet: bool = False,
+    stream: Optional[TextIO] = None,
+    min_interval: float = PROGRESS_MIN_INTERVAL,
+) -> Optional[ProgressCallback]:
+    """Return a callback that shows ``[done/total] name percent`` on one line.
+
+    An entry counts as done once a call reports ``bytes_done >= entry_size``.
+    Redraws are throttled to one per *min_interval*; the line is drawn a final
+    time and ended with a newline when the last of *total_files* is done.
+
+    Args:
+        total_files: Number of entries that will be reported.
+        quiet: If True, no callback is created.
+        stream: Text stream to draw on (default: ``sys.stderr``).
+        min_interval: Minimum time between redraws, in seconds.
+
+    Returns:
+        The callback, or None when *quiet* is True.
+    """
+    if quiet:
+        return None
+    out = stream if stream is not None else sys.stderr
+    done = 0
+    last_draw = float("-inf")
+    last_width = 0
+
+    def callback(name: str, current: int, total: int) -> None:
+        nonlocal done, last_draw, last_width
+        if current >= total:
+            done += 1
+        finished = done >= total_files
+        now = time.monotonic()
+        if not finished and now - last_draw < min_interval:
+            return
+        last_draw = now
+
+        percent = 100 * current // total if total else 100
+        line = f"[{done}/{total_files}] {name} {percent}%"
+        # Pad over the remains of a longer previous line
+        out.write("\r" + line.ljust(last_width) + ("\n" if finished else ""))
+        out.flush()
+        last_width = 0 if finished else len(line)
+
+    return callback
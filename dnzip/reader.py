@@ -21,10 +21,9 @@ This module provides the ZipReader class for reading ZIP and ZIP64 archives.
 """
 
 import io
-import zlib
-from typing import BinaryIO, Optional
+from typing import BinaryIO, Iterator, Optional
 
-from .constants import COMP_STORED, COMP_DEFLATE, COMPRESSION_STORED, COMPRESSION_DEFLATE, FLAG_DATA_DESCRIPTOR, FLAG_ENCRYPTED
+from .constants import COMP_STORED, COMP_DEFLATE, COMP_ZSTD, COMPRESSION_STORED, COMPRESSION_DEFLATE, FLAG_DATA_DESCRIPTOR, FLAG_ENCRYPTED
 from .errors import ZipCompressionError, ZipCrcError, ZipFormatError, ZipUnsupportedFeature
 from .structures import (
     EndOfCentralDirectory,
@@ -40,7 +39,7 @@ from .structures import (
     parse_zip64_locator,
     parse_zip64_extra_field,
 )
-from .utils import crc32, read_exact
+from .utils import crc32, deflate_decompress, read_exact, zstd_decompress
 
 
 class ZipReader:
@@ -417,14 +416,11 @@ class ZipReader:
         if entry.compression_method == COMP_STORED:
             return compressed_data
         elif entry.compression_method == COMP_DEFLATE:
-            try:
-                decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
-                data = decompressor.decompress(compressed_data)
-                if decompressor.unused_data:
-                    raise ZipCompressionError("Extra data after compressed stream")
-                return data
-            except zlib.error as e:
-                raise ZipCompressionError(f"Deflate decompression failed: {e}") from e
+            # One-shot decompression into a buffer of the known size (libdeflate when available)
+            return deflate_decompress(compressed_data, entry.uncompressed_size)
+        elif entry.compression_method == COMP_ZSTD:
+            # Needs the optional zstandard package
+            return zstd_decompress(compressed_data, entry.uncompressed_size)
         else:
             raise ZipUnsupportedFeature(
                 f"Unsupported compression method: {entry.compression_method}"
@@ -454,6 +450,18 @@ class ZipReader:
         """
         return list(self._entries.keys())
 
+    def iter_infos(self) -> Iterator[ZipEntry]:
+        """Iterate over entry metadata in central directory order.
+
+        Walks the already-parsed central directory once, so callers that need
+        every entry's metadata should prefer this over ``list()`` followed by
+        ``get_info()`` per name.
+
+        Yields:
+            ZipEntry objects (files and directories).
+        """
+        yield from self._entries.values()
+
     def get_info(self, name: str) -> Optional[ZipEntry]:
         """Get metadata for a specific entry.
 
@@ -468,11 +476,54 @@ class ZipReader:
             name = name.replace("\\", "/")
         return self._entries.get(name)
 
-    def open(self, name: str) -> BinaryIO:
+    def get_data_offset(self, name: str) -> int:
+        """Get the absolute file offset of an entry's compressed data.
+
+        The offset is found by parsing the entry's local file header, whose
+        filename and extra field lengths may differ from the central directory.
+        Together with ZipEntry.compressed_size this allows callers to read the
+        raw entry data with positional reads (e.g. os.pread) from other threads.
+
+        Args:
+            name: Entry name.
+
+        Returns:
+            Offset of the first byte of compressed data.
+
+        Raises:
+            ZipFormatError: If the archive is closed or the local header is invalid.
+            KeyError: If entry is not found.
+        """
+        if self._closed or self._file is None:
+            raise ZipFormatError("Archive is closed")
+
+        if "\\" in name:
+            name = name.replace("\\", "/")
+
+        if name not in self._entries:
+            raise KeyError(f"Entry not found: {name}")
+
+        entry = self._entries[name]
+        self._file.seek(entry.local_header_offset)
+        parse_local_file_header(self._file)
+        data_offset = self._file.tell()
+
+        self._file.seek(0, io.SEEK_END)
+        file_size = self._file.tell()
+        if data_offset + entry.compressed_size > file_size:
+            raise ZipFormatError(
+                f"Compressed data extends beyond file for entry '{entry.name}': "
+                f"position {data_offset}, size {entry.compressed_size} (file size: {file_size})"
+            )
+
+        return data_offset
+
+    def open(self, name: str, verify_crc: bool = True) -> BinaryIO:
         """Open an entry for reading decompressed data.
 
         Args:
             name: Entry name to open.
+            verify_crc: If False, skip CRC32 validation of the decompressed data.
 
         Returns:
             BinaryIO file-like object containing decompressed data.
@@ -503,7 +554,8 @@ class ZipReader:
         data = self._decompress_entry(entry)
 
         # Validate CRC32
-        self._validate_crc32(data, entry.crc32)
+        if verify_crc:
+            self._validate_crc32(data, entry.crc32)
 
         return io.BytesIO(data)
 
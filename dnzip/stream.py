@@ -58,8 +58,6 @@ class StreamingZipWriter(ZipWriter):
             ZipFormatError: If the archive is closed.
             ZipUnsupportedFeature: If compression method is not supported.
         """
-        # Read all data from stream
-        # Note: True streaming with on-the-fly compression would require
-        # more complex implementation. For now, we read all data first.
-        data = stream.read()
-        self.add_bytes(name, data, compression, use_data_descriptor=True)
+        # ZipWriter.add_stream compresses the stream chunk by chunk and
+        # writes a data descriptor after the data
+        super().add_stream(name, stream, compression)
@@ -37,7 +37,7 @@ except ImportError:
     # Fallback for Python < 3.9
     from backports.zoneinfo import ZoneInfo
 
-from .errors import ZipFormatError, ZipCrcError, ZipCompressionError
+from .errors import ZipFormatError, ZipCrcError, ZipCompressionError, ZipUnsupportedFeature
 
 # Import writers for edge case archive generation (optional, may not be available)
 try:
@@ -64,16 +64,194 @@ except ImportError:
         return None
 
 
-def crc32(data: bytes) -> int:
+# Optional libdeflate bindings (PyPI "deflate"): faster one-shot DEFLATE
+# compression/decompression and a SIMD-accelerated CRC32
+try:
+    import deflate as _libdeflate
+except ImportError:
+    _libdeflate = None
+
+# Optional Zstandard bindings (PyPI "zstandard") for ZIP compression method 93
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
+
+# Exceptions raised by zstd compressors/decompressors; empty (catches nothing)
+# when the bindings are not installed
+ZSTD_ERRORS = (_zstd.ZstdError,) if _zstd is not None else ()
+
+# Optional SIMD-accelerated CRC32 (PCLMULQDQ folding) with a zlib-compatible
+# crc32(data, value) signature. python-isal wraps ISA-L, deflate wraps libdeflate.
+# Without either, zlib.crc32 is the fallback.
+try:
+    from isal.isal_zlib import crc32 as _accelerated_crc32
+except ImportError:
+    _accelerated_crc32 = _libdeflate.crc32 if _libdeflate is not None else None
+
+# Buffers smaller than this go through zlib.crc32; the accelerated
+# implementations only pay off once their fixed setup cost is amortized.
+_ACCELERATED_CRC32_MIN_SIZE = 256
+
+
+def crc32(data: bytes, value: int = 0) -> int:
     """Calculate CRC32 checksum for data.
 
+    Uses an accelerated implementation (python-isal or libdeflate bindings)
+    for large buffers when one is installed, and zlib.crc32 otherwise.
+
     Args:
-        data: Bytes to calculate CRC32 for.
+        data: Bytes (or any buffer-protocol object) to calculate CRC32 for.
+        value: Running CRC32 of preceding data, for incremental calculation.
 
     Returns:
         CRC32 value as unsigned 32-bit integer.
     """
-    return zlib.crc32(data) & 0xFFFFFFFF
+    if _accelerated_crc32 is not None and len(data) >= _ACCELERATED_CRC32_MIN_SIZE:
+        return _accelerated_crc32(data, value) & 0xFFFFFFFF
+    return zlib.crc32(data, value) & 0xFFFFFFFF
+
+
+# Highest compression level accepted by libdeflate (zlib stops at 9)
+MAX_DEFLATE_LEVEL = 12
+
+
+def has_libdeflate() -> bool:
+    """Return True if the libdeflate bindings (PyPI "deflate") are installed."""
+    return _libdeflate is not None
+
+
+def deflate_compress(data: bytes, level: int = 6) -> bytes:
+    """Compress data as a raw DEFLATE stream (no zlib/gzip wrapper).
+
+    Uses libdeflate when available (levels 0-12), otherwise zlib (levels
+    above 9 are treated as 9).
+
+    Args:
+        data: Data to compress.
+        level: Compression level (0-12).
+
+    Returns:
+        Raw DEFLATE compressed data.
+
+    Raises:
+        ZipCompressionError: If compression fails.
+    """
+    try:
+        if _libdeflate is not None:
+            return _libdeflate.deflate_compress(data, level)
+        compressor = zlib.compressobj(level=min(level, 9), wbits=-zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+    except Exception as e:
+        raise ZipCompressionError(f"Deflate compression failed: {e}") from e
+
+
+def deflate_decompress(data: bytes, uncompressed_size: int) -> bytes:
+    """Decompress a raw DEFLATE stream whose uncompressed size is known.
+
+    Uses libdeflate's one-shot decompressor when available, otherwise zlib.
+
+    Args:
+        data: Raw DEFLATE compressed data.
+        uncompressed_size: Expected size of the decompressed data.
+
+    Returns:
+        Decompressed data.
+
+    Raises:
+        ZipCompressionError: If decompression fails or the size does not match.
+    """
+    if _libdeflate is not None and uncompressed_size > 0:
+        try:
+            return _libdeflate.deflate_decompress(data, uncompressed_size)
+        except Exception as e:
+            raise ZipCompressionError(f"Deflate decompression failed: {e}") from e
+
+    try:
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        result = decompressor.decompress(data)
+    except zlib.error as e:
+        raise ZipCompressionError(f"Deflate decompression failed: {e}") from e
+    if decompressor.unused_data:
+        raise ZipCompressionError("Extra data after compressed stream")
+    return result
+
+
+# Inputs at least this large are compressed with zstd's worker threads (one per
+# CPU); below it, starting the workers costs more than they save
+_ZSTD_MT_MIN_SIZE = 1024 * 1024  # 1 MiB
+
+
+def has_zstd() -> bool:
+    """Return True if the Zstandard bindings (PyPI "zstandard") are installed."""
+    return _zstd is not None
+
+
+def _require_zstd() -> None:
+    if _zstd is None:
+        raise ZipUnsupportedFeature(
+            "Zstandard compression (method 93) requires the 'zstandard' package"
+        )
+
+
+def zstd_compressobj(level: int = 3, size: int = -1):
+    """Return an incremental Zstandard compressor with compress()/flush() methods.
+
+    Compression runs on zstd's worker threads (one per CPU). Level 0 selects
+    zstd's default level (3).
+
+    Args:
+        level: Compression level.
+        size: Total input size, recorded in the frame header, or -1 if unknown.
+
+    Raises:
+        ZipUnsupportedFeature: If the zstandard package is not installed.
+    """
+    _require_zstd()
+    return _zstd.ZstdCompressor(level=level, threads=-1).compressobj(size=size)
+
+
+def zstd_compress(data: bytes, level: int = 3) -> bytes:
+    """Compress data as a single Zstandard frame.
+
+    Args:
+        data: Data to compress.
+        level: Compression level (0 selects zstd's default level, 3).
+
+    Returns:
+        Zstandard compressed data.
+
+    Raises:
+        ZipUnsupportedFeature: If the zstandard package is not installed.
+        ZipCompressionError: If compression fails.
+    """
+    _require_zstd()
+    threads = -1 if len(data) >= _ZSTD_MT_MIN_SIZE else 0
+    try:
+        return _zstd.ZstdCompressor(level=level, threads=threads).compress(data)
+    except _zstd.ZstdError as e:
+        raise ZipCompressionError(f"Zstandard compression failed: {e}") from e
+
+
+def zstd_decompress(data: bytes, uncompressed_size: int) -> bytes:
+    """Decompress a Zstandard frame whose uncompressed size is known.
+
+    Args:
+        data: Zstandard compressed data.
+        uncompressed_size: Expected size of the decompressed data.
+
+    Returns:
+        Decompressed data.
+
+    Raises:
+        ZipUnsupportedFeature: If the zstandard package is not installed.
+        ZipCompressionError: If decompression fails.
+    """
+    _require_zstd()
+    try:
+        return _zstd.ZstdDecompressor().decompress(data, max_output_size=uncompressed_size)
+    except _zstd.ZstdError as e:
+        raise ZipCompressionError(f"Zstandard decompression failed: {e}") from e
 
 
 def dos_datetime_to_timestamp(dos_date: int, dos_time: int) -> datetime:
@@ -485,6 +663,8 @@ def safe_extract_path(
     entry_name: str,
     allow_absolute_paths: bool = False,
     max_path_length: Optional[int] = None,
+    resolved_target_dir: Optional[str] = None,
+    verified_dirs: Optional[set] = None,
 ) -> Path:
     """
     Compute a safe extraction path for an entry with comprehensive security validation.
@@ -497,6 +677,19 @@ def safe_extract_path(
         entry_name: Name of the entry to extract.
         allow_absolute_paths: If False (default), absolute paths are rejected.
         max_path_length: Maximum allowed path length. If None, no limit is enforced.
+        resolved_target_dir: Optional result of ``str(target_dir.resolve())``.
+            Callers extracting many entries should resolve the target directory
+            once and pass it here; the containment check is then done with
+            ``os.path.normpath`` string math instead of resolving every entry
+            path (which stats each path component). In this mode entries with
+            ".." components are rejected outright. Symlinks already present
+            under the target directory are still followed: the entry's parent
+            directory is resolved with ``os.path.realpath`` and the entry
+            itself is checked with ``os.path.islink``.
+        verified_dirs: Optional set, shared across the entries of one
+            extraction, of parent directories already found to resolve inside
+            *resolved_target_dir*; each directory is then resolved only once.
+            Only used together with *resolved_target_dir*.
 
     Returns:
         Safe Path object pointing to the extraction location.
@@ -511,8 +704,17 @@ def safe_extract_path(
     # Validate entry name for security issues
     validate_entry_name(entry_name, allow_absolute_paths, max_path_length)
 
-    # Normalize ZIP-style separators and strip leading slashes
+    # Normalize ZIP-style separators and strip leading slashes. For clean names
+    # (the common case) both calls return the original string without copying;
+    # str.translate() would rebuild the string and is much slower here.
     normalized = entry_name.replace("\\", "/").lstrip("/")
+
+    if resolved_target_dir is not None:
+        return _safe_extract_path_prefix(
+            resolved_target_dir, entry_name, normalized, allow_absolute_paths, max_path_length,
+            verified_dirs,
+        )
+
     target_path = (target_dir / normalized).resolve()
 
     try:
@@ -575,6 +777,84 @@ def safe_extract_path(
     return target_path
 
 
+def _safe_extract_path_prefix(
+    resolved_target_dir: str,
+    entry_name: str,
+    normalized: str,
+    allow_absolute_paths: bool,
+    max_path_length: Optional[int],
+    verified_dirs: Optional[set] = None,
+) -> Path:
+    """Containment check for safe_extract_path() against a pre-resolved target directory.
+
+    The normalized entry path is checked with string operations first. Symlinks
+    that already exist under the target directory are then caught by resolving
+    the entry's parent directory (once per directory when *verified_dirs* is
+    given) and, if the entry itself is a symlink, the entry path.
+    """
+    audit_logger = get_audit_logger()
+    prefix = resolved_target_dir.rstrip(os.sep) + os.sep
+
+    def inside(path: str) -> bool:
+        return path == resolved_target_dir or path.startswith(prefix)
+
+    if ".." in normalized.split("/") or (
+        not allow_absolute_paths and len(normalized) >= 2 and normalized[1] == ":"
+    ):
+        candidate = None
+        target_path = os.path.join(resolved_target_dir, normalized)
+    else:
+        candidate = os.path.normpath(os.path.join(resolved_target_dir, normalized))
+        target_path = candidate
+
+    if candidate is not None and inside(candidate):
+        parent = os.path.dirname(candidate)
+        if verified_dirs is None or parent not in verified_dirs:
+            real_parent = os.path.realpath(parent)
+            if inside(real_parent):
+                if verified_dirs is not None:
+                    verified_dirs.add(parent)
+            else:
+                candidate = None
+                target_path = os.path.join(real_parent, os.path.basename(target_path))
+        if candidate is not None and os.path.islink(candidate):
+            real_candidate = os.path.realpath(candidate)
+            if not inside(real_candidate):
+                candidate = None
+                target_path = real_candidate
+    else:
+        candidate = None
+
+    if candidate is None:
+        error_msg = (
+            f"Refusing to extract outside target directory: {entry_name!r} "
+            f"(would extract to {target_path})"
+        )
+        if audit_logger:
+            audit_logger.log_path_traversal_attempt(
+                entry_name=entry_name,
+                target_path=str(target_path),
+                operation="extract",
+                target_dir=resolved_target_dir,
+                allow_absolute_paths=allow_absolute_paths,
+                max_path_length=max_path_length
+            )
+        raise ZipFormatError(error_msg)
+
+    if audit_logger:
+        audit_logger.log_extraction_operation(
+            entry_name=entry_name,
+            target_path=candidate,
+            operation="extract",
+            success=True,
+            target_dir=resolved_target_dir,
+            allow_absolute_paths=allow_absolute_paths,
+            max_path_length=max_path_length
+        )
+
+    return Path(candidate)
+
+
 def detect_split_archive(file_path: str) -> tuple[bool, list[str], str]:
     """
     Detect if a file path is part of a split ZIP archive and enumerate all parts.
@@ -1671,6 +1951,7 @@ def optimize_archive(
                             8: 'deflate',
                             12: 'bzip2',
                             14: 'lzma',
+                            93: 'zstd',
                             98: 'ppmd',
                         }
                         entry_compression = method_map.get(original_method, 'deflate')
@@ -1851,37 +2132,11 @@ def format_ppmd_properties(model_order: int, memory_mb: int) -> bytes:
     return struct.pack('<BI', model_order, memory_mb)
 
 
-def detect_archive_format(file_path: Union[str, os.PathLike], validate: bool = False) -> Optional[str]:
-    """
-    Detect archive format by reading magic numbers from file.
-    
-    This function reads the first few bytes of a file to determine its archive
-    format based on magic numbers (file signatures). Supports all formats
-    implemented in DNZIP: ZIP, TAR, GZIP, BZIP2, XZ, 7Z, and RAR.
-    
-    Args:
-        file_path: Path to the archive file to detect.
-        validate: If True, perform basic validation of detected format by attempting
-            to open the archive with the appropriate reader. Default is False.
-        
-    Returns:
-        Format name as string ('zip', 'tar', 'gzip', 'bzip2', 'xz', '7z', 'rar'),
-        or None if format cannot be detected.
-        
-    Raises:
-        OSError: If file cannot be opened or read.
-        ZipFormatError: If file is too small to contain a valid signature or validation fails.
-        FileNotFoundError: If file does not exist.
-        
-    Example:
-        from dnzip.utils import detect_archive_format
-        
-        format_name = detect_archive_format("archive.zip")
-        if format_name == "zip":
-            from dnzip import ZipReader
-            with ZipReader("archive.zip") as z:
-                # Process ZIP archive
-                pass
+def _sniff_archive_format(file_path: Path) -> Tuple[Optional[str], bytes]:
+    """Match the signature of *file_path* against the known archive formats.
+
+    Returns the format name (or None) and the first bytes of the file. Raises
+    like detect_archive_format(), but never logs, so it suits batch probing.
     """
     from .constants import (
         LOCAL_FILE_HEADER,
@@ -1896,8 +2151,6 @@ def detect_archive_format(file_path: Union[str, os.PathLike], validate: bool = F
         RAR_MAGIC_V5,
     )
     
-    file_path = Path(file_path)
-    
     # Check if file exists
     if not file_path.exists():
         raise FileNotFoundError(
@@ -1965,7 +2218,7 @@ def detect_archive_format(file_path: Union[str, os.PathLike], validate: bool = F
         if header[0:7] == RAR_MAGIC_V4:
             detected_format = "rar"
     if not detected_format and len(header) >= 8:
-        if header[0:8] == RAR_MAGIC_V4_OLD or header[0:8] == RAR_MAGIC_V5:
+        if header.startswith(RAR_MAGIC_V4_OLD) or header[0:8] == RAR_MAGIC_V5:
             detected_format = "rar"
     
     # Check TAR format (magic numbers at offset 257, need to read more)
@@ -1992,6 +2245,44 @@ def detect_archive_format(file_path: Union[str, os.PathLike], validate: bool = F
             # If we can't read TAR magic, continue (file might be too small)
             pass
     
+    return detected_format, header
+
+
+def detect_archive_format(file_path: Union[str, os.PathLike], validate: bool = False) -> Optional[str]:
+    """
+    Detect archive format by reading magic numbers from file.
+    
+    This function reads the first few bytes of a file to determine its archive
+    format based on magic numbers (file signatures). Supports all formats
+    implemented in DNZIP: ZIP, TAR, GZIP, BZIP2, XZ, 7Z, and RAR.
+    
+    Args:
+        file_path: Path to the archive file to detect.
+        validate: If True, perform basic validation of detected format by attempting
+            to open the archive with the appropriate reader. Default is False.
+        
+    Returns:
+        Format name as string ('zip', 'tar', 'gzip', 'bzip2', 'xz', '7z', 'rar'),
+        or None if format cannot be detected.
+        
+    Raises:
+        OSError: If file cannot be opened or read.
+        ZipFormatError: If file is too small to contain a valid signature or validation fails.
+        FileNotFoundError: If file does not exist.
+        
+    Example:
+        from dnzip.utils import detect_archive_format
+        
+        format_name = detect_archive_format("archive.zip")
+        if format_name == "zip":
+            from dnzip import ZipReader
+            with ZipReader("archive.zip") as z:
+                # Process ZIP archive
+                pass
+    """
+    file_path = Path(file_path)
+    detected_format, header = _sniff_archive_format(file_path)
+    
     # If format detected, optionally validate it
     if detected_format and validate:
         try:
@@ -2055,6 +2346,55 @@ def detect_archive_format(file_path: Union[str, os.PathLike], validate: bool = F
     return None
 
 
+# Below this many paths, detect_archive_formats() probes serially; thread
+# start-up costs more than it saves for a handful of header reads
+_PARALLEL_DETECT_MIN_PATHS = 8
+
+
+def detect_archive_formats(
+    file_paths: List[Union[str, os.PathLike]],
+    max_workers: int = 16,
+) -> Dict[Path, Optional[str]]:
+    """
+    Detect the archive format of many files, reading their headers in parallel.
+    
+    Each file's signature is checked as in `detect_archive_format()`, without
+    its log message for unrecognized files. For directory scans the
+    cost per file is dominated by open/read latency rather than CPU, so the
+    header reads are issued from a thread pool to keep several requests in
+    flight at once. Small batches are probed serially.
+    
+    Args:
+        file_paths: Paths of the files to classify.
+        max_workers: Maximum number of concurrent header reads (default: 16).
+    
+    Returns:
+        Dictionary mapping each path (as a Path) to its format name, or to None
+        if the format was not recognized or the file could not be read.
+    
+    Example:
+        from dnzip.utils import detect_archive_formats
+        
+        formats = detect_archive_formats(Path("downloads").iterdir())
+        zips = [path for path, fmt in formats.items() if fmt == "zip"]
+    """
+    paths = [Path(file_path) for file_path in file_paths]
+    
+    def probe(path: Path) -> Optional[str]:
+        try:
+            return _sniff_archive_format(path)[0]
+        except (OSError, ZipFormatError):
+            return None
+    
+    if len(paths) < _PARALLEL_DETECT_MIN_PATHS or max_workers <= 1:
+        return {path: probe(path) for path in paths}
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return dict(zip(paths, executor.map(probe, paths)))
+
+
 def merge_archives(
     output_path: Union[str, os.PathLike],
     archive_paths: list[Union[str, os.PathLike]],
@@ -2077,6 +2417,9 @@ def merge_archives(
             Must have methods: __init__(path), list(), get_info(name), open(name).
         writer_class: Optional writer class to use (defaults to ZipWriter).
             Must have methods: __init__(path), add_bytes(name, data, ...), close().
+            If the reader has get_data_offset(name) and the writer has
+            add_precompressed(), unencrypted entries are copied without being
+            decompressed and compressed again.
         overwrite: If True, overwrite existing output file. If False (default),
             raises error if output file exists.
         conflict_resolution: Strategy for handling entry name conflicts:
@@ -2093,6 +2436,8 @@ def merge_archives(
         - 'entries_overwritten': Number of entries overwritten (if conflict_resolution="overwrite")
         - 'entries_renamed': Number of entries renamed (if conflict_resolution="rename")
         - 'conflicts': List of entry names that had conflicts
+        - 'entries_failed': Number of entries that could not be read or written
+        - 'errors': One "archive: entry: error" message per failed entry
     
     Raises:
         ZipFormatError: If output file exists and overwrite=False, or if conflict_resolution="error"
@@ -2110,6 +2455,8 @@ def merge_archives(
         print(f"Added {result['entries_added']} entries")
         print(f"Renamed {result['entries_renamed']} entries due to conflicts")
     """
+    from .constants import FLAG_ENCRYPTED, METHOD_TO_NAME
+
     if reader_class is None:
         from .reader import ZipReader
         reader_class = ZipReader
@@ -2141,10 +2488,15 @@ def merge_archives(
     entries_overwritten = 0
     entries_renamed = 0
     conflicts = []
+    errors = []
     seen_names = {}  # Track seen entry names and their source archive index
     
     # Open output archive for writing
     with writer_class(output_path) as writer:
+        # Compressed entry data can be copied byte-for-byte when the reader can
+        # locate it and the writer accepts precompressed entries
+        raw_copy = hasattr(reader_class, 'get_data_offset') and hasattr(writer, 'add_precompressed')
+        
         # Process each source archive
         for archive_idx, archive_path in enumerate(archive_paths):
             archive_path = Path(archive_path)
@@ -2152,14 +2504,16 @@ def merge_archives(
             if not archive_path.exists():
                 raise ZipFormatError(f"Source archive not found: {archive_path}")
             
-            # Open source archive for reading
-            with reader_class(archive_path) as reader:
+            # Open source archive for reading (and a raw handle for copying)
+            with reader_class(archive_path) as reader, open(archive_path, 'rb') as raw_file:
                 # Get list of entries
                 entry_names = reader.list()
                 total_entries += len(entry_names)
                 
-                # Process each entry
-                for entry_name in entry_names:
+                # Process each entry; entry_name is the output name, which
+                # differs from source_name when a conflict is renamed
+                for source_name in entry_names:
+                    entry_name = source_name
                     # Check for conflicts
                     if entry_name in seen_names:
                         conflicts.append(entry_name)
@@ -2192,30 +2546,50 @@ def merge_archives(
                     
                     # Get entry info
                     try:
-                        entry_info = reader.get_info(entry_name)
+                        entry_info = reader.get_info(source_name)
                         if entry_info is None:
                             continue  # Skip if entry info not available
                         
-                        # Read entry data
-                        with reader.open(entry_name) as entry_file:
-                            entry_data = entry_file.read()
-                        
-                        # Add entry to output archive
-                        # Try to preserve compression method and other metadata
+                        # Try to preserve compression method and level
                         compression_method = getattr(entry_info, 'compression_method', None)
                         compression_level = getattr(entry_info, 'compression_level', None)
-                        comment = getattr(entry_info, 'comment', None)
                         
                         # Determine compression method string
-                        compression = "stored"
-                        if compression_method == 0:  # STORED
-                            compression = "stored"
-                        elif compression_method == 8:  # DEFLATE
-                            compression = "deflate"
-                        elif compression_method == 12:  # BZIP2
-                            compression = "bzip2"
-                        elif compression_method == 14:  # LZMA
-                            compression = "lzma"
+                        compression = METHOD_TO_NAME.get(compression_method)
+                        
+                        # Read entry data; empty entries are stored without
+                        # opening a decompressor or running a compressor
+                        if getattr(entry_info, 'uncompressed_size', None) == 0:
+                            if raw_copy:
+                                writer.add_precompressed(entry_name, b"", 0, 0, compression="stored")
+                            else:
+                                writer.add_bytes(entry_name, b"", compression="stored", compression_level=0)
+                            entries_added += 1
+                            seen_names[entry_name] = archive_idx
+                            continue
+                        elif (
+                            raw_copy
+                            and compression is not None
+                            and not getattr(entry_info, 'flags', 0) & FLAG_ENCRYPTED
+                        ):
+                            # Copy the compressed data as-is instead of
+                            # decompressing and compressing it again
+                            raw_file.seek(reader.get_data_offset(source_name))
+                            writer.add_precompressed(
+                                entry_name,
+                                raw_file.read(entry_info.compressed_size),
+                                entry_info.crc32,
+                                entry_info.uncompressed_size,
+                                compression=compression,
+                            )
+                            entries_added += 1
+                            seen_names[entry_name] = archive_idx
+                            continue
+                        else:
+                            with reader.open(source_name) as entry_file:
+                                entry_data = entry_file.read()
+                            if compression is None:
+                                compression = "stored"
                         
                         # Add entry with preserved metadata
                         writer.add_bytes(
@@ -2223,16 +2597,14 @@ def merge_archives(
                             entry_data,
                             compression=compression,
                             compression_level=compression_level if compression_level is not None else 6,
-                            comment=comment if comment else None,
                         )
                         
                         entries_added += 1
                         seen_names[entry_name] = archive_idx
                         
                     except Exception as e:
-                        # Log error but continue processing other entries
-                        # In production, you might want to collect these errors
-                        continue
+                        # Record the error and continue with the other entries
+                        errors.append(f"{archive_path}: {source_name}: {e}")
     
     return {
         'total_entries': total_entries,
@@ -2241,6 +2613,8 @@ def merge_archives(
         'entries_overwritten': entries_overwritten,
         'entries_renamed': entries_renamed,
         'conflicts': conflicts,
+        'entries_failed': len(errors),
+        'errors': errors,
     }
 
 
@@ -3223,9 +3597,54 @@ def convert_archive(
     return result
 
 
+def compile_search_pattern(
+    pattern: str,
+    use_regex: bool = False,
+    case_sensitive: bool = True,
+) -> "re.Pattern":
+    """
+    Compile an entry name search pattern once for repeated matching.
+    
+    Glob patterns are translated with ``fnmatch.translate()`` and anchored at
+    the start, so ``.search(name)`` on the result matches exactly the names
+    ``fnmatch`` would. Regular expressions are compiled as given. The result
+    can be passed as ``pattern`` to `search_archive()` (or as
+    ``filename_pattern`` to `search_archive_content()`) to avoid recompiling
+    it for every archive searched.
+    
+    Args:
+        pattern: Glob pattern, or regular expression if use_regex=True.
+        use_regex: If True, treat pattern as a regular expression.
+        case_sensitive: If False, match case-insensitively.
+    
+    Returns:
+        Compiled pattern; use its ``search()`` method to test entry names.
+    
+    Raises:
+        ValueError: If pattern is not a valid regular expression.
+    
+    Example:
+        from dnzip.utils import compile_search_pattern, search_archive
+        
+        txt_files = compile_search_pattern("*.txt", case_sensitive=False)
+        for path in ("a.zip", "b.zip"):
+            results = search_archive(path, txt_files)
+    """
+    import fnmatch
+    import re
+    
+    flags = 0 if case_sensitive else re.IGNORECASE
+    if use_regex:
+        try:
+            return re.compile(pattern, flags)
+        except re.error as e:
+            raise ValueError(f"Invalid regular expression pattern: {pattern} ({e})")
+    return re.compile(r"\A" + fnmatch.translate(pattern), flags)
+
+
 def search_archive(
     archive_path: str | os.PathLike,
-    pattern: str,
+    pattern: Union[str, "re.Pattern"],
     use_regex: bool = False,
     case_sensitive: bool = True,
     reader_class=None,
@@ -3239,7 +3658,9 @@ def search_archive(
     
     Args:
         archive_path: Path to the archive to search.
-        pattern: Pattern to search for (glob pattern by default, regex if use_regex=True).
+        pattern: Pattern to search for (glob pattern by default, regex if use_regex=True),
+                 or a pattern precompiled with `compile_search_pattern()`, in which
+                 case use_regex and case_sensitive are ignored.
         use_regex: If True, treat pattern as a regular expression. If False (default),
                    treat pattern as a glob pattern (supports *, ?, [chars], etc.).
         case_sensitive: If True (default), pattern matching is case-sensitive.
@@ -3273,29 +3694,18 @@ def search_archive(
         # Case-insensitive search
         results = search_archive("archive.zip", "*.TXT", case_sensitive=False)
     """
-    import fnmatch
     import re
     
     if reader_class is None:
         from .reader import ZipReader
         reader_class = ZipReader
     
-    # Compile pattern based on type
-    if use_regex:
-        # Regular expression pattern
-        flags = 0 if case_sensitive else re.IGNORECASE
-        try:
-            pattern_re = re.compile(pattern, flags)
-        except re.error as e:
-            raise ValueError(f"Invalid regular expression pattern: {pattern} ({e})")
-        match_func = lambda name: pattern_re.search(name) is not None
+    # Compile the pattern once (globs become anchored regular expressions)
+    if isinstance(pattern, re.Pattern):
+        pattern_re = pattern
     else:
-        # Glob pattern
-        if case_sensitive:
-            match_func = lambda name: fnmatch.fnmatch(name, pattern)
-        else:
-            # Case-insensitive glob matching
-            match_func = lambda name: fnmatch.fnmatch(name.lower(), pattern.lower())
+        pattern_re = compile_search_pattern(pattern, use_regex, case_sensitive)
+    match_func = pattern_re.search
     
     results = []
     
@@ -3306,7 +3716,7 @@ def search_archive(
         
         # Search through entries
         for entry_name in entry_names:
-            if match_func(entry_name):
+            if match_func(entry_name) is not None:
                 # Get entry information
                 try:
                     entry_info = archive.get_info(entry_name)
@@ -3337,8 +3747,8 @@ def search_archive(
 
 def search_archive_content(
     archive_path: str | os.PathLike,
-    search_text: Union[str, bytes],
-    filename_pattern: Optional[str] = None,
+    search_text: Union[str, bytes, "re.Pattern"],
+    filename_pattern: Union[str, "re.Pattern", None] = None,
     use_regex: bool = False,
     case_sensitive: bool = True,
     text_encoding: str = 'utf-8',
@@ -3356,9 +3766,12 @@ def search_archive_content(
     
     Args:
         archive_path: Path to the archive to search.
-        search_text: Text or bytes pattern to search for within file contents.
+        search_text: Text or bytes pattern to search for within file contents, or a
+                    precompiled regular expression (str pattern for text mode, bytes
+                    pattern for binary mode), which implies use_regex=True.
         filename_pattern: Optional glob pattern to filter which files to search
-                         (e.g., "*.txt" to search only text files). If None, searches all files.
+                         (e.g., "*.txt" to search only text files), or a pattern
+                         precompiled with `compile_search_pattern()`. If None, searches all files.
         use_regex: If True, treat search_text as a regular expression. If False (default),
                    performs plain text/binary search.
         case_sensitive: If True (default), search is case-sensitive. Only applies to text mode.
@@ -3415,7 +3828,6 @@ def search_archive_content(
             filename_pattern="*.png"
         )
     """
-    import fnmatch
     import re
     
     if reader_class is None:
@@ -3423,7 +3835,12 @@ def search_archive_content(
         reader_class = ZipReader
     
     # Validate search_text
-    if binary_mode:
+    if isinstance(search_text, re.Pattern):
+        if binary_mode != isinstance(search_text.pattern, bytes):
+            kind = "bytes" if binary_mode else "str"
+            raise ValueError(f"search_text must be a {kind} pattern when binary_mode={binary_mode}")
+        use_regex = True
+    elif binary_mode:
         if not isinstance(search_text, bytes):
             raise ValueError("search_text must be bytes when binary_mode=True")
     else:
@@ -3435,7 +3852,9 @@ def search_archive_content(
                 raise ValueError(f"Cannot decode search_text as {text_encoding}")
     
     # Compile search pattern
-    if use_regex:
+    if isinstance(search_text, re.Pattern):
+        search_pattern = search_text
+    elif use_regex:
         if binary_mode:
             # Binary regex search
             flags = 0
@@ -3461,11 +3880,10 @@ def search_archive_content(
     
     # Compile filename pattern if provided
     filename_match_func = None
-    if filename_pattern:
-        if case_sensitive:
-            filename_match_func = lambda name: fnmatch.fnmatch(name, filename_pattern)
-        else:
-            filename_match_func = lambda name: fnmatch.fnmatch(name.lower(), filename_pattern.lower())
+    if isinstance(filename_pattern, re.Pattern):
+        filename_match_func = filename_pattern.search
+    elif filename_pattern:
+        filename_match_func = compile_search_pattern(filename_pattern, case_sensitive=case_sensitive).search
     
     results = []
     
@@ -3486,7 +3904,7 @@ def search_archive_content(
                     continue
                 
                 # Filter by filename pattern if provided
-                if filename_match_func and not filename_match_func(entry_name):
+                if filename_match_func and filename_match_func(entry_name) is None:
                     continue
                 
                 # Check file size limit
@@ -5034,6 +5452,121 @@ def analyze_rar_compatibility(
     return result
 
 
+def _batch_process_one(
+    archive_path: Path,
+    operation: str,
+    output_dir: Path,
+    operation_params: dict,
+    reader_class,
+) -> dict:
+    """Run a batch_process_archives() *operation* on one archive and return its result dict.
+
+    Exceptions propagate to the caller, which records them.
+    """
+    result = {
+        'archive_path': str(archive_path),
+        'success': False,
+        'result': None,
+        'error': None,
+        'operation': operation,
+    }
+
+    if not archive_path.exists():
+        raise OSError(f"Archive not found: {archive_path}")
+
+    if operation == 'extract':
+        # Extract archive to subdirectory
+        archive_name = archive_path.stem
+        extract_dir = output_dir / archive_name
+        extract_dir.mkdir(parents=True, exist_ok=True)
+
+        reader = reader_class(archive_path)
+        try:
+            reader.extract_all(extract_dir)
+            result['result'] = {'extract_dir': str(extract_dir)}
+            result['success'] = True
+        finally:
+            reader.close()
+
+    elif operation == 'validate':
+        # Validate archive
+        from .utils import validate_and_repair_archive
+        validation_result = validate_and_repair_archive(
+            archive_path,
+            reader_class=reader_class,
+            crc_verification=operation_params.get('crc_verification', 'strict')
+        )
+        result['result'] = validation_result
+        result['success'] = validation_result['valid']
+
+    elif operation == 'list':
+        # List entries in archive
+        reader = reader_class(archive_path)
+        try:
+            entries = reader.list()
+            entry_info = []
+            for entry_name in entries:
+                info = reader.get_info(entry_name)
+                entry_info.append({
+                    'name': entry_name,
+                    'size': info.get('size', 0),
+                    'compressed_size': info.get('compressed_size', 0),
+                    'is_directory': info.get('is_directory', False),
+                })
+            result['result'] = {'entries': entry_info, 'count': len(entries)}
+            result['success'] = True
+        finally:
+            reader.close()
+
+    elif operation == 'statistics':
+        # Get archive statistics
+        from .utils import get_archive_statistics
+        stats = get_archive_statistics(archive_path, reader_class=reader_class)
+        result['result'] = stats
+        result['success'] = True
+
+    elif operation == 'convert':
+        # Convert archive format
+        if 'target_format' not in operation_params:
+            raise ValueError("operation_params must include 'target_format' for convert operation")
+
+        target_format = operation_params['target_format']
+        target_path = output_dir / f"{archive_path.stem}.{target_format}"
+
+        from .utils import convert_archive
+        convert_result = convert_archive(
+            archive_path,
+            target_path,
+            source_format=operation_params.get('source_format'),
+            target_format=target_format,
+            compression=operation_params.get('compression'),
+            compression_level=operation_params.get('compression_level'),
+            password=operation_params.get('password'),
+            preserve_metadata=operation_params.get('preserve_metadata', True),
+        )
+        result['result'] = convert_result
+        result['success'] = True
+
+    elif operation == 'optimize':
+        # Optimize archive
+        target_path = output_dir / archive_path.name
+
+        from .utils import optimize_archive
+        optimize_result = optimize_archive(
+            archive_path,
+            target_path,
+            compression=operation_params.get('compression'),
+            compression_level=operation_params.get('compression_level'),
+            preserve_metadata=operation_params.get('preserve_metadata', True),
+            password=operation_params.get('password'),
+            reader_class=reader_class,
+        )
+        result['result'] = optimize_result
+        result['success'] = True
+
+    return result
+
+
 def batch_process_archives(
     archive_paths: List[Union[str, os.PathLike]],
     operation: str,
@@ -5042,6 +5575,7 @@ def batch_process_archives(
     reader_class=None,
     progress_callback: Optional[Callable[[str, int, int, str], None]] = None,
     stop_on_error: bool = False,
+    max_workers: int = 1,
 ) -> dict:
     """
     Process multiple archives in batch with a specified operation.
@@ -5074,6 +5608,13 @@ def batch_process_archives(
                           is 'processing', 'success', or 'error'.
         stop_on_error: If True, stop processing on first error. If False (default),
                       continue processing remaining archives.
+        max_workers: Number of archives processed concurrently (default: 1, sequential).
+                    With more than one worker, archives run on a thread pool (the
+                    compression codecs release the GIL) and results keep the input
+                    order. progress_callback is then called from the calling thread
+                    as each archive finishes, with no 'processing' events and
+                    current counting finished archives. With stop_on_error,
+                    archives that have not started yet are cancelled.
     
     Returns:
         Dictionary with batch processing results:
@@ -5142,149 +5683,72 @@ def batch_process_archives(
     if operation_params is None:
         operation_params = {}
     
-    results = []
-    successful = 0
-    failed = 0
-    
     total = len(archive_paths)
-    
-    for idx, archive_path in enumerate(archive_paths):
-        archive_path = Path(archive_path)
-        result = {
+    archive_paths = [Path(archive_path) for archive_path in archive_paths]
+    results: List[Optional[dict]] = [None] * total
+
+    def record_error(idx: int, archive_path: Path, error: Exception) -> None:
+        results[idx] = {
             'archive_path': str(archive_path),
             'success': False,
             'result': None,
-            'error': None,
+            'error': str(error),
             'operation': operation,
         }
-        
-        if progress_callback:
-            progress_callback(str(archive_path), idx + 1, total, 'processing')
-        
-        try:
-            if not archive_path.exists():
-                raise OSError(f"Archive not found: {archive_path}")
-            
-            if operation == 'extract':
-                # Extract archive to subdirectory
-                archive_name = archive_path.stem
-                extract_dir = output_dir / archive_name
-                extract_dir.mkdir(parents=True, exist_ok=True)
-                
-                reader = reader_class(archive_path)
-                try:
-                    reader.extract_all(extract_dir)
-                    result['result'] = {'extract_dir': str(extract_dir)}
-                    result['success'] = True
-                    successful += 1
-                finally:
-                    reader.close()
-            
-            elif operation == 'validate':
-                # Validate archive
-                from .utils import validate_and_repair_archive
-                validation_result = validate_and_repair_archive(
-                    archive_path,
-                    reader_class=reader_class,
-                    crc_verification=operation_params.get('crc_verification', 'strict')
-                )
-                result['result'] = validation_result
-                result['success'] = validation_result['valid']
-                if result['success']:
-                    successful += 1
-                else:
-                    failed += 1
-            
-            elif operation == 'list':
-                # List entries in archive
-                reader = reader_class(archive_path)
+
+    if max_workers > 1 and total > 1:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, total)) as executor:
+            futures = {
+                executor.submit(
+                    _batch_process_one, archive_path, operation, output_dir, operation_params, reader_class
+                ): (idx, archive_path)
+                for idx, archive_path in enumerate(archive_paths)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                idx, archive_path = futures[future]
                 try:
-                    entries = reader.list()
-                    entry_info = []
-                    for entry_name in entries:
-                        info = reader.get_info(entry_name)
-                        entry_info.append({
-                            'name': entry_name,
-                            'size': info.get('size', 0),
-                            'compressed_size': info.get('compressed_size', 0),
-                            'is_directory': info.get('is_directory', False),
-                        })
-                    result['result'] = {'entries': entry_info, 'count': len(entries)}
-                    result['success'] = True
-                    successful += 1
-                finally:
-                    reader.close()
-            
-            elif operation == 'statistics':
-                # Get archive statistics
-                from .utils import get_archive_statistics
-                stats = get_archive_statistics(archive_path, reader_class=reader_class)
-                result['result'] = stats
-                result['success'] = True
-                successful += 1
-            
-            elif operation == 'convert':
-                # Convert archive format
-                if 'target_format' not in operation_params:
-                    raise ValueError("operation_params must include 'target_format' for convert operation")
-                
-                target_format = operation_params['target_format']
-                target_path = output_dir / f"{archive_path.stem}.{target_format}"
-                
-                from .utils import convert_archive
-                convert_result = convert_archive(
-                    archive_path,
-                    target_path,
-                    source_format=operation_params.get('source_format'),
-                    target_format=target_format,
-                    compression=operation_params.get('compression'),
-                    compression_level=operation_params.get('compression_level'),
-                    password=operation_params.get('password'),
-                    preserve_metadata=operation_params.get('preserve_metadata', True),
-                )
-                result['result'] = convert_result
-                result['success'] = True
-                successful += 1
-            
-            elif operation == 'optimize':
-                # Optimize archive
-                target_path = output_dir / archive_path.name
-                
-                from .utils import optimize_archive
-                optimize_result = optimize_archive(
-                    archive_path,
-                    target_path,
-                    compression=operation_params.get('compression'),
-                    compression_level=operation_params.get('compression_level'),
-                    preserve_metadata=operation_params.get('preserve_metadata', True),
-                    password=operation_params.get('password'),
-                    reader_class=reader_class,
+                    results[idx] = future.result()
+                except Exception as e:
+                    record_error(idx, archive_path, e)
+                    if progress_callback:
+                        progress_callback(str(archive_path), done, total, 'error')
+                    if stop_on_error:
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+                    continue
+                if progress_callback:
+                    status = 'success' if results[idx]['success'] else 'error'
+                    progress_callback(str(archive_path), done, total, status)
+    else:
+        for idx, archive_path in enumerate(archive_paths):
+            if progress_callback:
+                progress_callback(str(archive_path), idx + 1, total, 'processing')
+
+            try:
+                results[idx] = _batch_process_one(
+                    archive_path, operation, output_dir, operation_params, reader_class
                 )
-                result['result'] = optimize_result
-                result['success'] = True
-                successful += 1
-            
+            except Exception as e:
+                record_error(idx, archive_path, e)
+                if progress_callback:
+                    progress_callback(str(archive_path), idx + 1, total, 'error')
+                if stop_on_error:
+                    raise
+                continue
+
             if progress_callback:
-                status = 'success' if result['success'] else 'error'
+                status = 'success' if results[idx]['success'] else 'error'
                 progress_callback(str(archive_path), idx + 1, total, status)
-        
-        except Exception as e:
-            result['error'] = str(e)
-            result['success'] = False
-            failed += 1
-            
-            if progress_callback:
-                progress_callback(str(archive_path), idx + 1, total, 'error')
-            
-            if stop_on_error:
-                raise
-        
-        results.append(result)
-    
+
+    successful = sum(1 for result in results if result['success'])
+
     return {
         'total': total,
         'successful': successful,
-        'failed': failed,
+        'failed': total - successful,
         'results': results,
     }
 
@@ -5413,6 +5877,55 @@ def filter_files_by_type(
     return filtered
 
 
+def _makedirs_cached(directory: str, created: set) -> None:
+    """Create *directory* (and its parents) unless it is already known to exist.
+
+    *created* holds directories known to exist; it is updated with
+    *directory* and all of its ancestors, so entries sharing a parent cost a
+    set lookup instead of a ``mkdir`` syscall each.
+    """
+    if directory in created:
+        return
+    os.makedirs(directory, exist_ok=True)
+    while directory not in created:
+        created.add(directory)
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+
+
+def _iter_stream_chunks(src: BinaryIO, buffer: bytearray):
+    """
+    Yield successive chunks of *src*, read into the reusable *buffer*.
+    
+    Chunks are memoryviews into *buffer* and are only valid until the next
+    one is requested, so no new bytes object is allocated per chunk. Streams
+    without ``readinto`` fall back to ``read``.
+    """
+    readinto = getattr(src, "readinto", None)
+    if readinto is None:
+        while True:
+            chunk = src.read(len(buffer))
+            if not chunk:
+                return
+            yield chunk
+    view = memoryview(buffer)
+    while True:
+        n = readinto(buffer)
+        if not n:
+            return
+        yield view[:n]
+
+
+def _compile_glob_union(patterns: List[str]) -> "re.Pattern":
+    """Fuse glob patterns into one compiled regex matching like fnmatch.fnmatch."""
+    import fnmatch
+    import re
+    
+    return re.compile("(?:" + "|".join(fnmatch.translate(p) for p in patterns) + ")")
+
+
 def extract_with_filter(
     archive_path: Union[str, os.PathLike],
     output_dir: Union[str, os.PathLike],
@@ -5506,6 +6019,7 @@ def extract_with_filter(
     """
     import fnmatch
     from pathlib import Path
+    from .constants import COPY_BUFFER_SIZE
     
     if reader_class is None:
         from .reader import ZipReader
@@ -5514,6 +6028,15 @@ def extract_with_filter(
     archive_path = Path(archive_path)
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
+    # Resolved once; entry paths are then checked with string operations plus
+    # one realpath per parent directory (cached in verified_dirs)
+    resolved_output_dir = str(output_dir.resolve())
+    verified_dirs: set = set()
+    
+    # One reusable buffer for copying every extracted entry
+    copy_buffer = bytearray(COPY_BUFFER_SIZE)
+    # Directories already created, so entries sharing a parent skip mkdir
+    created_dirs = set()
     
     # Validate filter parameters
     if min_size is not None and max_size is not None and min_size > max_size:
@@ -5522,17 +6045,19 @@ def extract_with_filter(
     if start_date is not None and end_date is not None and start_date > end_date:
         raise ValueError(f"start_date ({start_date}) cannot be greater than end_date ({end_date})")
     
-    # Normalize patterns for case-insensitive matching
+    # Normalize patterns for case-insensitive matching and compile each list
+    # once into a single regex instead of running fnmatch per entry per pattern
+    include_re = exclude_re = None
     if include_patterns:
-        include_patterns = [p.lower() if not case_sensitive else p for p in include_patterns]
+        include_re = _compile_glob_union([p.lower() if not case_sensitive else p for p in include_patterns])
     if exclude_patterns:
-        exclude_patterns = [p.lower() if not case_sensitive else p for p in exclude_patterns]
+        exclude_re = _compile_glob_union([p.lower() if not case_sensitive else p for p in exclude_patterns])
     
-    # Normalize extensions
+    # Normalize extensions into sets for constant-time membership tests
     if include_extensions:
-        include_extensions = [ext.lower() if not case_sensitive else ext for ext in include_extensions]
+        include_extensions = frozenset(ext.lower() if not case_sensitive else ext for ext in include_extensions)
     if exclude_extensions:
-        exclude_extensions = [ext.lower() if not case_sensitive else ext for ext in exclude_extensions]
+        exclude_extensions = frozenset(ext.lower() if not case_sensitive else ext for ext in exclude_extensions)
     
     results = {
         'total_entries': 0,
@@ -5569,35 +6094,21 @@ def extract_with_filter(
                 matches = True
                 
                 # Extension filtering
-                if matches and include_extensions:
+                if include_extensions or exclude_extensions:
                     entry_ext = Path(entry_name).suffix
                     entry_ext = entry_ext.lower() if not case_sensitive else entry_ext
-                    if entry_ext not in include_extensions:
+                    if include_extensions and entry_ext not in include_extensions:
                         matches = False
-                
-                if matches and exclude_extensions:
-                    entry_ext = Path(entry_name).suffix
-                    entry_ext = entry_ext.lower() if not case_sensitive else entry_ext
-                    if entry_ext in exclude_extensions:
+                    elif exclude_extensions and entry_ext in exclude_extensions:
                         matches = False
                 
                 # Pattern filtering
-                if matches and include_patterns:
+                if matches and (include_re is not None or exclude_re is not None):
                     entry_name_check = entry_name.lower() if not case_sensitive else entry_name
-                    pattern_match = False
-                    for pattern in include_patterns:
-                        if fnmatch.fnmatch(entry_name_check, pattern):
-                            pattern_match = True
-                            break
-                    if not pattern_match:
+                    if include_re is not None and include_re.match(entry_name_check) is None:
+                        matches = False
+                    elif exclude_re is not None and exclude_re.match(entry_name_check) is not None:
                         matches = False
-                
-                if matches and exclude_patterns:
-                    entry_name_check = entry_name.lower() if not case_sensitive else entry_name
-                    for pattern in exclude_patterns:
-                        if fnmatch.fnmatch(entry_name_check, pattern):
-                            matches = False
-                            break
                 
                 # Size filtering
                 if matches and min_size is not None:
@@ -5635,14 +6146,16 @@ def extract_with_filter(
                         entry_name,
                         allow_absolute_paths=allow_absolute_paths,
                         max_path_length=max_path_length,
+                        resolved_target_dir=resolved_output_dir,
+                        verified_dirs=verified_dirs,
                     )
                     
                     if info.get('is_directory', False):
-                        target_path.mkdir(parents=True, exist_ok=True)
+                        _makedirs_cached(str(target_path), created_dirs)
                         results['extracted_entries'] += 1
                         continue
                     
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
+                    _makedirs_cached(str(target_path.parent), created_dirs)
                     
                     # Extract file
                     with reader.open(entry_name) as src, open(target_path, "wb") as dst:
@@ -5650,10 +6163,7 @@ def extract_with_filter(
                         total_bytes = info.get('size', 0)
                         
                         # Stream copy in chunks to support large files
-                        while True:
-                            chunk = src.read(1024 * 1024)  # 1MB chunks
-                            if not chunk:
-                                break
+                        for chunk in _iter_stream_chunks(src, copy_buffer):
                             dst.write(chunk)
                             bytes_extracted += len(chunk)
                             
@@ -8897,6 +9407,7 @@ def extract_with_conflict_resolution(
         print(f"Overwrote {result['overwritten_entries']} outdated files")
     """
     from pathlib import Path
+    from .constants import COPY_BUFFER_SIZE
     
     # Validate conflict strategy
     valid_strategies = ['overwrite', 'skip', 'rename', 'timestamp', 'size']
@@ -8913,6 +9424,15 @@ def extract_with_conflict_resolution(
     archive_path = Path(archive_path)
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
+    # Resolved once; entry paths are then checked with string operations plus
+    # one realpath per parent directory (cached in verified_dirs)
+    resolved_output_dir = str(output_dir.resolve())
+    verified_dirs: set = set()
+    
+    # One reusable buffer for copying every extracted entry
+    copy_buffer = bytearray(COPY_BUFFER_SIZE)
+    # Directories already created, so entries sharing a parent skip mkdir
+    created_dirs = set()
     
     results = {
         'total_entries': 0,
@@ -8966,18 +9486,20 @@ def extract_with_conflict_resolution(
                         entry_name,
                         allow_absolute_paths=allow_absolute_paths,
                         max_path_length=max_path_length,
+                        resolved_target_dir=resolved_output_dir,
+                        verified_dirs=verified_dirs,
                     )
                     
                     # Handle directory entries
                     if info.get('is_directory', False):
-                        target_path.mkdir(parents=True, exist_ok=True)
+                        _makedirs_cached(str(target_path), created_dirs)
                         results['extracted_entries'] += 1
                         if progress_callback:
                             progress_callback(entry_name, 0, 0, 'extracted')
                         continue
                     
                     # Ensure parent directory exists
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
+                    _makedirs_cached(str(target_path.parent), created_dirs)
                     
                     # Handle file conflicts based on strategy
                     final_path = target_path
@@ -9057,10 +9579,7 @@ def extract_with_conflict_resolution(
                         total_bytes = info.get('size', 0)
                         
                         # Stream copy in chunks to support large files
-                        while True:
-                            chunk = src.read(1024 * 1024)  # 1MB chunks
-                            if not chunk:
-                                break
+                        for chunk in _iter_stream_chunks(src, copy_buffer):
                             dst.write(chunk)
                             bytes_extracted += len(chunk)
                             
@@ -12619,6 +13138,8 @@ def recover_corrupted_archive(
     
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
+    resolved_output_dir = str(output_dir.resolve())
+    verified_dirs: set = set()
     
     recovered_entries = 0
     partial_entries = 0
@@ -12697,7 +13218,8 @@ def recover_corrupted_archive(
                     continue
                 
                 # Determine output path
-                safe_path = safe_extract_path(entry_name, output_dir)
+                safe_path = safe_extract_path(output_dir, entry_name, resolved_target_dir=resolved_output_dir,
+                                              verified_dirs=verified_dirs)
                 safe_path.parent.mkdir(parents=True, exist_ok=True)
                 
                 # Try to extract entry
@@ -98314,12 +98836,6 @@ def unified_archive_operations_manager(
     if operation not in supported_operations:
         raise ValueError(f"Unsupported operation: {operation}. Supported operations: {supported_operations}")
     
-        log_with_timestamp(
-            f"Starting unified_archive_operations_manager: operation={operation}, "
-            f"archives={len(archive_paths)}, timeout={timeout_seconds}s, "
-            f"error_strategy={error_strategy}, timestamp={start_timestamp}"
-        )
-    
     result = {
         "status": "unknown",
         "operation": operation,
@@ -116143,12 +116659,6 @@ def advanced_batch_format_operations_manager(
             f"Supported batch operations: {', '.join(batch_operations)}"
         )
     
-        log_with_timestamp(
-            f"Starting advanced_batch_format_operations_manager: operation={operation}, "
-            f"archives={len(archive_paths)}, timeout={timeout_seconds}s, "
-            f"timestamp={start_timestamp}"
-        )
-    
     result = {
         "status": "unknown",
         "operation": operation,
@@ -20,6 +20,7 @@ ZIP archive writer implementation.
 This module provides the ZipWriter class for creating ZIP and ZIP64 archives.
 """
 
+import mmap
 import os
 import struct
 import zlib
@@ -28,13 +29,16 @@ from typing import BinaryIO, Optional
 
 from .constants import (
     CENTRAL_DIR_HEADER,
+    COPY_BUFFER_SIZE,
     COMP_DEFLATE,
     COMP_STORED,
+    COMP_ZSTD,
     COMPRESSION_METHODS,
     DATA_DESCRIPTOR,
     END_OF_CENTRAL_DIR,
     FLAG_DATA_DESCRIPTOR,
     FLAG_UTF8,
+    FUSED_SLICE_SIZE,
     LOCAL_FILE_HEADER,
     MAX_CD_OFFSET,
     MAX_CD_SIZE,
@@ -49,14 +53,64 @@ from .constants import (
 )
 from .errors import ZipCompressionError, ZipFormatError, ZipUnsupportedFeature
 from .utils import (
+    MAX_DEFLATE_LEVEL,
     crc32,
+    deflate_compress,
+    has_libdeflate,
     timestamp_to_dos_datetime,
+    ZSTD_ERRORS,
+    zstd_compress,
+    zstd_compressobj,
     write_uint16,
     write_uint32,
     write_uint64,
 )
 
 
+# Largest file add_file() compresses in one call when libdeflate is available
+ONE_SHOT_DEFLATE_MAX_SIZE = 64 * 1024 * 1024  # 64 MiB
+
+
+# Sources at least this large are memory-mapped instead of read() into a bytes
+# object when they have to be compressed in one call
+MMAP_READ_THRESHOLD = 16 * 1024 * 1024  # 16 MiB
+
+
+def _advise_sequential(fd: int) -> None:
+    """Tell the kernel *fd* will be read once from start to end (where supported)."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _map_source(source: BinaryIO) -> mmap.mmap:
+    """Memory-map an open source file read-only for a single sequential pass.
+
+    The kernel pages the file in on demand, so compressing it does not need a
+    second, heap-allocated copy of its contents.
+    """
+    fd = source.fileno()
+    _advise_sequential(fd)
+    mapping = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    # Page faults on the mapping follow madvise(), not the fd's fadvise() hint
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapping.madvise(mmap.MADV_SEQUENTIAL)
+    return mapping
+
+
+def _deflate_bound(size: int) -> int:
+    """Return the maximum raw deflate output size for *size* input bytes.
+
+    Mirrors zlib's deflateBound() so callers can size headers before compressing.
+    """
+    return size + (size >> 12) + (size >> 14) + (size >> 25) + 13
+
+
+def _zstd_bound(size: int) -> int:
+    """Return the maximum Zstandard output size for *size* input bytes (ZSTD_COMPRESSBOUND)."""
+    small_input_margin = ((128 << 10) - size) >> 11 if size < (128 << 10) else 0
+    return size + (size >> 8) + small_input_margin
+
+
 class ZipWriter:
     """Writer for ZIP and ZIP64 archives.
 
@@ -105,13 +159,190 @@ class ZipWriter:
         self._current_offset: int = 0
         self._closed: bool = False
         self._needs_zip64: bool = False
+        # Copy buffer shared by all streamed entries (allocated on first use)
+        self._copy_buffer: Optional[bytearray] = None
+
+    def _normalize_entry_name(self, name: str) -> str:
+        """Normalize and validate an entry name.
+
+        Args:
+            name: Entry name (path within ZIP archive).
+
+        Returns:
+            Entry name with forward slash separators.
+
+        Raises:
+            ZipFormatError: If the entry name is empty, too long, or contains null bytes.
+        """
+        # Normalize path separators (use forward slash)
+        if "\\" in name:
+            name = name.replace("\\", "/")
+
+        # Encode filename to check length
+        name_bytes = name.encode("utf-8")
+
+        # Validate filename length (ZIP spec limits to 255 bytes)
+        # Note: Some ZIP implementations are more lenient, but we enforce the spec
+        if len(name_bytes) > 255:
+            raise ZipFormatError(f"Entry name too long: {len(name_bytes)} bytes (max 255 bytes per ZIP specification)")
+
+        # Validate filename is not empty
+        if not name:
+            raise ZipFormatError("Entry name cannot be empty")
+
+        # Validate filename doesn't contain null bytes (security/robustness)
+        if "\x00" in name:
+            raise ZipFormatError("Entry name cannot contain null bytes")
+
+        return name
+
+    def _validate_compression_level(self, compression_level: int) -> None:
+        """Validate a compression level.
+
+        Levels 0-9 match zlib; 10-12 are only meaningful with libdeflate and
+        behave like 9 when zlib is used.
+
+        Raises:
+            ZipFormatError: If the level is outside 0-12.
+        """
+        if not 0 <= compression_level <= MAX_DEFLATE_LEVEL:
+            raise ZipFormatError(
+                f"Invalid compression level: {compression_level} (must be 0-{MAX_DEFLATE_LEVEL})"
+            )
+
+    def _create_compressor(self, method: str, compression_level: int = 6):
+        """Create an incremental compressor for the specified method.
 
-    def _compress_data(self, data: bytes, method: str) -> bytes:
+        Incremental DEFLATE always uses zlib (libdeflate has no streaming API),
+        so levels above 9 are treated as 9. Zstandard uses the zstandard
+        package's multithreaded compressor.
+
+        Args:
+            method: Compression method name ("stored", "deflate", etc.).
+            compression_level: Compression level (0-12).
+
+        Returns:
+            Compressor object with compress()/flush() methods, or None for stored entries.
+
+        Raises:
+            ZipUnsupportedFeature: If compression method is not supported.
+        """
+        if method not in COMPRESSION_METHODS:
+            raise ZipUnsupportedFeature(f"Unsupported compression method: {method}")
+
+        comp_method = COMPRESSION_METHODS[method]
+
+        if comp_method == COMP_STORED:
+            return None
+        elif comp_method == COMP_DEFLATE:
+            return zlib.compressobj(level=min(compression_level, 9), wbits=-zlib.MAX_WBITS)
+        elif comp_method == COMP_ZSTD:
+            return zstd_compressobj(compression_level)
+        else:
+            raise ZipUnsupportedFeature(f"Compression method {method} not yet implemented")
+
+    def _write_entry_data(self, data) -> None:
+        """Write entry payload bytes and advance the current offset.
+
+        Args:
+            data: Bytes (or buffer-protocol object) to write.
+        """
+        written = self._file.write(data)
+        if written != len(data):
+            raise ZipFormatError(f"Write operation failed: expected to write {len(data)} bytes, wrote {written} bytes")
+        self._current_offset += written
+
+    def _stream_entry_data(self, stream: BinaryIO, compressor) -> tuple[int, int, int]:
+        """Compress data from a stream into the archive chunk by chunk.
+
+        Data is read in COPY_BUFFER_SIZE chunks into a buffer that is reused
+        across entries, so memory usage does not depend on the entry size.
+        When compressing, each chunk is processed in FUSED_SLICE_SIZE slices
+        that are CRC'd and compressed back to back in a single pass.
+
+        Args:
+            stream: Binary file-like object to read from.
+            compressor: Compressor from _create_compressor(), or None for stored entries.
+
+        Returns:
+            Tuple of (crc32, compressed_size, uncompressed_size).
+
+        Raises:
+            ZipFormatError: If the stream cannot be read or the archive cannot be written.
+            ZipCompressionError: If compression fails.
+        """
+        if self._file is None:
+            raise ZipFormatError("Archive file is closed")
+
+        if self._copy_buffer is None:
+            self._copy_buffer = bytearray(COPY_BUFFER_SIZE)
+        buffer = self._copy_buffer
+        view = memoryview(buffer)
+        readinto = getattr(stream, "readinto", None)
+
+        entry_crc32 = 0
+        compressed_size = 0
+        uncompressed_size = 0
+
+        while True:
+            try:
+                if readinto is not None:
+                    n = readinto(buffer)
+                    chunk = view[:n] if n else b""
+                else:
+                    chunk = stream.read(COPY_BUFFER_SIZE)
+                    n = len(chunk)
+            except OSError as e:
+                raise ZipFormatError(f"Failed to read from stream: {e}") from e
+            if not n:
+                break
+
+            uncompressed_size += n
+
+            if compressor is None:
+                entry_crc32 = crc32(chunk, entry_crc32)
+                self._write_entry_data(chunk)
+                compressed_size += n
+                continue
+
+            # CRC each slice and compress it right away, while it is still cached
+            chunk = memoryview(chunk)
+            for start in range(0, n, FUSED_SLICE_SIZE):
+                piece = chunk[start:start + FUSED_SLICE_SIZE]
+                entry_crc32 = crc32(piece, entry_crc32)
+                try:
+                    out = compressor.compress(piece)
+                except zlib.error as e:
+                    raise ZipCompressionError(f"Deflate compression failed: {e}") from e
+                except ZSTD_ERRORS as e:
+                    raise ZipCompressionError(f"Zstandard compression failed: {e}") from e
+                if out:
+                    self._write_entry_data(out)
+                    compressed_size += len(out)
+
+        if compressor is not None:
+            try:
+                out = compressor.flush()
+            except zlib.error as e:
+                raise ZipCompressionError(f"Deflate compression failed: {e}") from e
+            except ZSTD_ERRORS as e:
+                raise ZipCompressionError(f"Zstandard compression failed: {e}") from e
+            if out:
+                self._write_entry_data(out)
+                compressed_size += len(out)
+
+        return entry_crc32, compressed_size, uncompressed_size
+
+    def _compress_data(self, data: bytes, method: str, compression_level: int = 6) -> bytes:
         """Compress data using the specified method.
 
+        DEFLATE uses libdeflate when its bindings are installed, zlib otherwise.
+        Zstandard (method 93) needs the zstandard package.
+
         Args:
             data: Data to compress.
             method: Compression method name ("stored", "deflate", etc.).
+            compression_level: Compression level (0-12, see _validate_compression_level).
 
         Returns:
             Compressed data as bytes.
@@ -127,13 +358,9 @@ class ZipWriter:
         if comp_method == COMP_STORED:
             return data
         elif comp_method == COMP_DEFLATE:
-            try:
-                compressor = zlib.compressobj(level=zlib.Z_DEFAULT_COMPRESSION, wbits=-zlib.MAX_WBITS)
-                compressed = compressor.compress(data)
-                compressed += compressor.flush()
-                return compressed
-            except Exception as e:
-                raise ZipCompressionError(f"Deflate compression failed: {e}") from e
+            return deflate_compress(data, compression_level)
+        elif comp_method == COMP_ZSTD:
+            return zstd_compress(data, compression_level)
         else:
             raise ZipUnsupportedFeature(f"Compression method {method} not yet implemented")
 
@@ -146,8 +373,8 @@ class ZipWriter:
         Returns:
             True if ZIP64 is needed for this entry.
         """
-        compressed_size = len(entry_info["compressed_data"])
-        uncompressed_size = len(entry_info["data"])
+        compressed_size = entry_info["compressed_size"]
+        uncompressed_size = entry_info["uncompressed_size"]
 
         # Validate sizes are non-negative
         if compressed_size < 0 or uncompressed_size < 0:
@@ -197,8 +424,8 @@ class ZipWriter:
         Args:
             entry_info: Dictionary containing entry information:
                 - name: Entry name (str)
-                - data: Entry data (bytes)
-                - compressed_data: Compressed data (bytes)
+                - uncompressed_size: Size of the entry data (int)
+                - compressed_size: Size of the compressed data (int)
                 - crc32: CRC32 checksum (int)
                 - compression_method: Compression method ID (int)
                 - mod_time: Modification time (int, DOS time)
@@ -220,8 +447,8 @@ class ZipWriter:
             self._needs_zip64 = True
 
         # Create ZIP64 extra field if needed
-        compressed_size = len(entry_info["compressed_data"])
-        uncompressed_size = len(entry_info["data"])
+        compressed_size = entry_info["compressed_size"]
+        uncompressed_size = entry_info["uncompressed_size"]
 
         if needs_zip64:
             zip64_extra = self._write_zip64_extra_field(
@@ -304,8 +531,8 @@ class ZipWriter:
                 self._needs_zip64 = True
 
             # Create ZIP64 extra field if needed
-            compressed_size = len(entry_info["compressed_data"])
-            uncompressed_size = len(entry_info["data"])
+            compressed_size = entry_info["compressed_size"]
+            uncompressed_size = entry_info["uncompressed_size"]
 
             if needs_zip64:
                 zip64_extra = self._write_zip64_extra_field(
@@ -551,7 +778,12 @@ class ZipWriter:
             self._current_offset += 16  # Classic data descriptor size: 4 (sig) + 4 (crc) + 4 + 4 = 16
 
     def add_bytes(
-        self, name: str, data: bytes, compression: str = "deflate", use_data_descriptor: bool = False
+        self,
+        name: str,
+        data: bytes,
+        compression: str = "deflate",
+        use_data_descriptor: bool = False,
+        compression_level: int = 6,
     ) -> None:
         """Add an entry from bytes data.
 
@@ -560,6 +792,7 @@ class ZipWriter:
             data: Data to add as bytes.
             compression: Compression method ("stored", "deflate", etc.).
             use_data_descriptor: If True, use data descriptor (for streaming).
+            compression_level: Compression level (0-9 with zlib, 0-12 with libdeflate, default: 6).
 
         Raises:
             ZipFormatError: If the archive is closed.
@@ -568,31 +801,136 @@ class ZipWriter:
         if self._closed:
             raise ZipFormatError("Archive is closed")
 
-        # Normalize path separators (use forward slash)
-        if "\\" in name:
-            name = name.replace("\\", "/")
-
-        # Encode filename to check length
-        name_bytes = name.encode("utf-8")
-        
-        # Validate filename length (ZIP spec limits to 255 bytes)
-        # Note: Some ZIP implementations are more lenient, but we enforce the spec
-        if len(name_bytes) > 255:
-            raise ZipFormatError(f"Entry name too long: {len(name_bytes)} bytes (max 255 bytes per ZIP specification)")
-        
-        # Validate filename is not empty
-        if not name:
-            raise ZipFormatError("Entry name cannot be empty")
-        
-        # Validate filename doesn't contain null bytes (security/robustness)
-        if "\x00" in name:
-            raise ZipFormatError("Entry name cannot contain null bytes")
+        name = self._normalize_entry_name(name)
+        self._validate_compression_level(compression_level)
 
         # Calculate CRC32
         entry_crc32 = crc32(data)
 
         # Compress data
-        compressed_data = self._compress_data(data, compression)
+        compressed_data = self._compress_data(data, compression, compression_level)
+
+        self._write_compressed_entry(
+            name, compressed_data, entry_crc32, len(data), compression, use_data_descriptor
+        )
+
+    def add_precompressed(
+        self,
+        name: str,
+        compressed_data: bytes,
+        crc32_value: int,
+        uncompressed_size: int,
+        compression: str = "deflate",
+    ) -> None:
+        """Add an entry whose data has already been compressed.
+
+        This allows compression to happen outside the writer (for example in
+        worker threads via precompress_file()) while the archive itself is
+        written sequentially.
+
+        Args:
+            name: Entry name (path within ZIP archive).
+            compressed_data: Compressed entry data (raw deflate stream for "deflate").
+            crc32_value: CRC32 of the uncompressed data.
+            uncompressed_size: Size of the uncompressed data in bytes.
+            compression: Compression method used for compressed_data ("stored", "deflate", etc.).
+
+        Raises:
+            ZipFormatError: If the archive is closed or the sizes are invalid.
+            ZipUnsupportedFeature: If compression method is not supported.
+        """
+        if self._closed:
+            raise ZipFormatError("Archive is closed")
+
+        if compression not in COMPRESSION_METHODS:
+            raise ZipUnsupportedFeature(f"Unsupported compression method: {compression}")
+
+        if uncompressed_size < 0:
+            raise ZipFormatError(f"Invalid uncompressed size: {uncompressed_size} (must be non-negative)")
+
+        if COMPRESSION_METHODS[compression] == COMP_STORED and len(compressed_data) != uncompressed_size:
+            raise ZipFormatError(
+                f"Stored entry size mismatch: {len(compressed_data)} bytes of data, "
+                f"uncompressed size {uncompressed_size}"
+            )
+
+        name = self._normalize_entry_name(name)
+
+        self._write_compressed_entry(
+            name, compressed_data, crc32_value & 0xFFFFFFFF, uncompressed_size, compression, False
+        )
+
+    def precompress_file(
+        self, source_path: str, compression: str = "deflate", compression_level: int = 6
+    ) -> tuple[bytes, int, int]:
+        """Read and compress a file for a later add_precompressed() call.
+
+        This method does not touch the archive, so it is safe to call from
+        several threads at once (zlib releases the GIL while compressing).
+
+        Args:
+            source_path: Path to source file on disk.
+            compression: Compression method ("stored", "deflate", etc.).
+            compression_level: Compression level (0-9 with zlib, 0-12 with libdeflate, default: 6).
+
+        Returns:
+            Tuple of (compressed_data, crc32, uncompressed_size).
+
+        Raises:
+            ZipFormatError: If the source file cannot be read.
+            ZipUnsupportedFeature: If compression method is not supported.
+            ZipCompressionError: If compression fails.
+        """
+        self._validate_compression_level(compression_level)
+
+        try:
+            source = open(source_path, "rb")
+        except FileNotFoundError as e:
+            raise ZipFormatError(f"Source file not found: {source_path}") from e
+        except PermissionError as e:
+            raise ZipFormatError(f"Permission denied reading file: {source_path}") from e
+        except OSError as e:
+            raise ZipFormatError(f"Error reading file {source_path}: {e}") from e
+
+        with source:
+            try:
+                # Stored data is returned as-is, so it must outlive the file
+                if compression != "stored" and os.fstat(source.fileno()).st_size >= MMAP_READ_THRESHOLD:
+                    mapped = _map_source(source)
+                else:
+                    mapped = None
+                    data = source.read()
+            except (OSError, ValueError) as e:
+                raise ZipFormatError(f"Error reading file {source_path}: {e}") from e
+
+            if mapped is None:
+                return self._compress_data(data, compression, compression_level), crc32(data), len(data)
+            with mapped:
+                return (
+                    self._compress_data(mapped, compression, compression_level),
+                    crc32(mapped),
+                    len(mapped),
+                )
+
+    def _write_compressed_entry(
+        self,
+        name: str,
+        compressed_data: bytes,
+        entry_crc32: int,
+        uncompressed_size: int,
+        compression: str,
+        use_data_descriptor: bool,
+    ) -> None:
+        """Write local header, compressed data and optional data descriptor for an entry.
+
+        Args:
+            name: Normalized entry name.
+            compressed_data: Compressed entry data.
+            entry_crc32: CRC32 of the uncompressed data.
+            uncompressed_size: Size of the uncompressed data in bytes.
+            compression: Compression method name used for compressed_data.
+            use_data_descriptor: If True, use data descriptor (for streaming).
+        """
         compression_method = COMPRESSION_METHODS[compression]
 
         # Get current time for modification date
@@ -604,7 +942,6 @@ class ZipWriter:
 
         # Determine if ZIP64 is needed
         compressed_size = len(compressed_data)
-        uncompressed_size = len(data)
         needs_zip64 = (
             uncompressed_size > MAX_FILE_SIZE
             or compressed_size > MAX_FILE_SIZE
@@ -619,8 +956,8 @@ class ZipWriter:
         # Write local file header
         entry_info = {
             "name": name,
-            "data": data,
-            "compressed_data": compressed_data,
+            "uncompressed_size": uncompressed_size,
+            "compressed_size": compressed_size,
             "crc32": entry_crc32,
             "compression_method": compression_method,
             "mod_time": mod_time,
@@ -630,8 +967,6 @@ class ZipWriter:
             "use_data_descriptor": use_data_descriptor,
             "needs_zip64": needs_zip64,
         }
-        
-        # Note: name_bytes already calculated above for validation
 
         if use_data_descriptor:
             # Write local header with zero sizes
@@ -642,11 +977,8 @@ class ZipWriter:
         # Write compressed data
         if self._file is None:
             raise ZipFormatError("Archive file is closed")
-        
-        written = self._file.write(compressed_data)
-        if written != len(compressed_data):
-            raise ZipFormatError(f"Write operation failed: expected to write {len(compressed_data)} bytes, wrote {written} bytes")
-        self._current_offset += len(compressed_data)
+
+        self._write_entry_data(compressed_data)
 
         # Write data descriptor if needed
         if use_data_descriptor:
@@ -725,7 +1057,7 @@ class ZipWriter:
         self._current_offset += 30 + filename_len + extra_len
 
     def add_stream(
-        self, name: str, stream: BinaryIO, compression: str = "deflate"
+        self, name: str, stream: BinaryIO, compression: str = "deflate", compression_level: int = 6
     ) -> None:
         """Add an entry from a stream (unknown size).
 
@@ -733,6 +1065,7 @@ class ZipWriter:
             name: Entry name (path within ZIP archive).
             stream: Binary file-like object to read from.
             compression: Compression method ("stored", "deflate", etc.).
+            compression_level: Compression level (0-9, default: 6).
 
         Raises:
             ZipFormatError: If the archive is closed or stream cannot be read.
@@ -744,25 +1077,63 @@ class ZipWriter:
         # Validate stream has read method
         if not hasattr(stream, 'read'):
             raise ZipFormatError("Stream object must have a read() method")
-        
-        # Read all data from stream (for now - true streaming would require
-        # more complex implementation with on-the-fly compression)
-        try:
-            data = stream.read()
-        except Exception as e:
-            raise ZipFormatError(f"Failed to read from stream: {e}") from e
-        
-        self.add_bytes(name, data, compression, use_data_descriptor=True)
+
+        name = self._normalize_entry_name(name)
+        self._validate_compression_level(compression_level)
+        compressor = self._create_compressor(compression, compression_level)
+
+        now = datetime.now()
+        mod_date, mod_time = timestamp_to_dos_datetime(now)
+        local_header_offset = self._current_offset
+
+        # Sizes and CRC32 are unknown until the stream is consumed, so the local
+        # header carries zeros and the real values follow in a data descriptor
+        entry_info = {
+            "name": name,
+            "uncompressed_size": 0,
+            "compressed_size": 0,
+            "crc32": 0,
+            "compression_method": COMPRESSION_METHODS[compression],
+            "mod_time": mod_time,
+            "mod_date": mod_date,
+            "flags": FLAG_UTF8 | FLAG_DATA_DESCRIPTOR,
+            "local_header_offset": local_header_offset,
+            "use_data_descriptor": True,
+            "needs_zip64": local_header_offset > MAX_FILE_SIZE,
+        }
+        self._write_local_file_header_with_data_descriptor(entry_info)
+
+        entry_crc32, compressed_size, uncompressed_size = self._stream_entry_data(stream, compressor)
+        entry_info["crc32"] = entry_crc32
+        entry_info["compressed_size"] = compressed_size
+        entry_info["uncompressed_size"] = uncompressed_size
+        entry_info["needs_zip64"] = self._needs_zip64_for_entry(entry_info)
+
+        self._write_data_descriptor(entry_crc32, compressed_size, uncompressed_size, entry_info["needs_zip64"])
+        self._pending_entries.append(entry_info)
 
     def add_file(
-        self, name_in_zip: str, source_path: str, compression: str = "deflate"
+        self,
+        name_in_zip: str,
+        source_path: str,
+        compression: str = "deflate",
+        compression_level: int = 6,
     ) -> None:
         """Add an entry from a file on disk.
 
+        The file is streamed into the archive in fixed-size chunks, so it is
+        never loaded into memory as a whole. The local header is written with
+        provisional sizes and patched once the data has been written.
+
+        When libdeflate is available, DEFLATE entries up to
+        ONE_SHOT_DEFLATE_MAX_SIZE are instead compressed in one call, since
+        libdeflate has no streaming API.
+
         Args:
             name_in_zip: Entry name (path within ZIP archive).
             source_path: Path to source file on disk.
             compression: Compression method ("stored", "deflate", etc.).
+            compression_level: Compression level (0-9 with zlib, 0-12 with libdeflate, default: 6).
 
         Raises:
             ZipFormatError: If the source file cannot be read.
@@ -770,19 +1141,109 @@ class ZipWriter:
         """
         if self._closed:
             raise ZipFormatError("Archive is closed")
-        
-        if not os.path.exists(source_path):
-            raise ZipFormatError(f"Source file not found: {source_path}")
+        if self._file is None:
+            raise ZipFormatError("Archive file is closed")
+
+        name_in_zip = self._normalize_entry_name(name_in_zip)
+        self._validate_compression_level(compression_level)
+        compressor = self._create_compressor(compression, compression_level)
 
         try:
-            with open(source_path, "rb") as f:
-                data = f.read()
+            source = open(source_path, "rb")
+        except FileNotFoundError as e:
+            raise ZipFormatError(f"Source file not found: {source_path}") from e
         except PermissionError as e:
             raise ZipFormatError(f"Permission denied reading file: {source_path}") from e
         except OSError as e:
             raise ZipFormatError(f"Error reading file {source_path}: {e}") from e
 
-        self.add_bytes(name_in_zip, data, compression)
+        with source:
+            try:
+                source_size = os.fstat(source.fileno()).st_size
+                if compression == "deflate" and has_libdeflate() and source_size <= ONE_SHOT_DEFLATE_MAX_SIZE:
+                    if source_size >= MMAP_READ_THRESHOLD:
+                        data = _map_source(source)
+                    else:
+                        data = source.read()
+                else:
+                    data = None
+            except (OSError, ValueError) as e:
+                raise ZipFormatError(f"Error reading file {source_path}: {e}") from e
+
+            if data is not None:
+                try:
+                    compressed_data = self._compress_data(data, compression, compression_level)
+                    entry_crc32 = crc32(data)
+                    uncompressed_size = len(data)
+                finally:
+                    if isinstance(data, mmap.mmap):
+                        data.close()
+                self._write_compressed_entry(
+                    name_in_zip,
+                    compressed_data,
+                    entry_crc32,
+                    uncompressed_size,
+                    compression,
+                    False,
+                )
+                return
+
+            now = datetime.now()
+            mod_date, mod_time = timestamp_to_dos_datetime(now)
+            local_header_offset = self._current_offset
+            header_position = self._file.tell()
+
+            # Use the worst-case compressed size to decide up front whether the
+            # header needs a ZIP64 extra field; it cannot grow after the data
+            entry_info = {
+                "name": name_in_zip,
+                "uncompressed_size": source_size,
+                "compressed_size": (
+                    source_size if compressor is None
+                    else _zstd_bound(source_size) if compression == "zstd"
+                    else _deflate_bound(source_size)
+                ),
+                "crc32": 0,
+                "compression_method": COMPRESSION_METHODS[compression],
+                "mod_time": mod_time,
+                "mod_date": mod_date,
+                "flags": FLAG_UTF8,
+                "local_header_offset": local_header_offset,
+                "use_data_descriptor": False,
+            }
+            needs_zip64 = self._needs_zip64_for_entry(entry_info)
+            entry_info["needs_zip64"] = needs_zip64
+            self._write_local_file_header(entry_info)
+
+            try:
+                _advise_sequential(source.fileno())
+            except OSError:
+                pass  # Only a read-ahead hint
+            entry_crc32, compressed_size, uncompressed_size = self._stream_entry_data(source, compressor)
+
+        entry_info["crc32"] = entry_crc32
+        entry_info["compressed_size"] = compressed_size
+        entry_info["uncompressed_size"] = uncompressed_size
+        if not needs_zip64 and self._needs_zip64_for_entry(entry_info):
+            raise ZipFormatError(f"Source file grew while being added to the archive: {source_path}")
+
+        # Patch CRC32 and sizes into the local header (CRC32 is at offset 14)
+        end_position = self._file.tell()
+        self._file.seek(header_position + 14)
+        write_uint32(self._file, entry_crc32)
+        if needs_zip64:
+            write_uint32(self._file, MAX_FILE_SIZE)
+            write_uint32(self._file, MAX_FILE_SIZE)
+            # Skip filename length, extra length, filename and extra field header
+            self._file.seek(header_position + 30 + len(name_in_zip.encode("utf-8")) + 4)
+            write_uint64(self._file, uncompressed_size)
+            write_uint64(self._file, compressed_size)
+        else:
+            write_uint32(self._file, compressed_size)
+            write_uint32(self._file, uncompressed_size)
+        self._file.seek(end_position)
+
+        self._pending_entries.append(entry_info)
 
     def close(self) -> None:
         """Write central directory and EOCD, then close the archive."""
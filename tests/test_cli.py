@@ -0,0 +1,128 @@
+"""Tests for the ``python -m dnzip`` command-line interface."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=False
+    )
+
+
+def test_import_does_not_load_command_modules():
+    result = _run(
+        "-c",
+        "import sys, dnzip.__main__; "
+        "print(' '.join(m for m in sys.modules if m.startswith('dnzip.')))",
+    )
+    assert result.returncode == 0, result.stderr
+    loaded = result.stdout.split()
+    assert "dnzip.utils" not in loaded
+    assert "dnzip.reader" not in loaded
+    assert "dnzip.writer" not in loaded
+
+
+def test_help_runs():
+    result = _run("-m", "dnzip", "--help")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith("usage: dnzip")
+
+
+def test_list_runs(tmp_path):
+    from dnzip import ZipWriter
+
+    archive = tmp_path / "a.zip"
+    with ZipWriter(archive) as writer:
+        writer.add_bytes("b.txt", b"b")
+        writer.add_bytes("a.txt", b"a")
+
+    result = _run("-m", "dnzip", "list", str(archive), "--sort")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == ["a.txt", "b.txt"]
+
+
+def test_extract_runs(tmp_path):
+    from dnzip import ZipWriter
+
+    archive = tmp_path / "a.zip"
+    with ZipWriter(archive) as writer:
+        writer.add_bytes("dir/a.txt", b"a" * 1000)
+        writer.add_bytes("b.txt", b"b")
+    output = tmp_path / "out"
+
+    result = _run("-m", "dnzip", "extract", str(archive), "-d", str(output), "-j", "2")
+    assert result.returncode == 0, result.stderr
+    assert (output / "dir" / "a.txt").read_bytes() == b"a" * 1000
+    assert (output / "b.txt").read_bytes() == b"b"
+    assert "[2/2]" in result.stderr
+
+
+@pytest.mark.parametrize("jobs", ["1", "4"])
+@pytest.mark.parametrize("compression", ["stored", "deflate"])
+def test_create_runs(tmp_path, jobs, compression):
+    from dnzip import ZipReader
+
+    sources = tmp_path / "src"
+    (sources / "sub").mkdir(parents=True)
+    contents = {f"sub/{i}.txt": f"file {i}\n".encode() * (i + 1) for i in range(10)}
+    for name, data in contents.items():
+        (sources / name).write_bytes(data)
+    archive = tmp_path / "a.zip"
+
+    result = _run(
+        "-m", "dnzip", "create", str(archive), str(sources), "-j", jobs, "-c", compression
+    )
+    assert result.returncode == 0, result.stderr
+    assert "[10/10]" in result.stderr
+    with ZipReader(archive) as z:
+        extracted = {
+            name.split("/", 1)[1]: z.open(name).read()
+            for name in z.list()
+            if not name.endswith("/")
+        }
+    assert extracted == contents
+
+
+def test_create_rejects_unsupported_options(tmp_path):
+    source = tmp_path / "a.txt"
+    source.write_bytes(b"a")
+
+    result = _run("-m", "dnzip", "create", str(tmp_path / "a.zip"), str(source), "--comment", "hi")
+    assert result.returncode == 2
+    assert "comments are not supported" in result.stderr
+    assert not (tmp_path / "a.zip").exists()
+
+
+def test_xz_decompress_streams_to_file(tmp_path):
+    import lzma
+
+    data = b"xz data\n" * 100000
+    # Two concatenated streams, as written by xz-compress with several threads
+    source = tmp_path / "data.txt.xz"
+    source.write_bytes(lzma.compress(data[:1000]) + lzma.compress(data[1000:]))
+
+    result = _run("-m", "dnzip", "xz-decompress", str(source))
+    assert result.returncode == 0, result.stderr
+    assert (tmp_path / "data.txt").read_bytes() == data
+
+    truncated = tmp_path / "truncated.xz"
+    truncated.write_bytes(lzma.compress(data)[:100])
+    result = _run("-m", "dnzip", "xz-decompress", str(truncated))
+    assert result.returncode == 1
+    assert not (tmp_path / "truncated").exists()
+
+
+def test_xz_compress_round_trip(tmp_path):
+    import lzma
+
+    data = b"xz data\n" * 100000
+    source = tmp_path / "data.txt"
+    source.write_bytes(data)
+    target = tmp_path / "data.txt.xz"
+
+    result = _run("-m", "dnzip", "xz-compress", str(source), "-o", str(target), "--compression-level", "1")
+    assert result.returncode == 0, result.stderr
+    assert lzma.decompress(target.read_bytes()) == data
@@ -0,0 +1,86 @@
+"""Tests for archive format detection."""
+
+import gzip
+import os
+import tarfile
+
+import pytest
+
+import dnzip.__main__ as cli
+from dnzip import ZipWriter
+from dnzip.utils import _PARALLEL_DETECT_MIN_PATHS, detect_archive_format, detect_archive_formats
+
+
+def _make_zip(path):
+    with ZipWriter(path) as writer:
+        writer.add_bytes("a.txt", b"a")
+    return path
+
+
+def _make_tar(path):
+    member = path.parent / "member.txt"
+    member.write_bytes(b"tar member")
+    with tarfile.open(path, "w") as tar:
+        tar.add(member, arcname="member.txt")
+    return path
+
+
+def test_detect_archive_format_by_content(tmp_path):
+    gz = tmp_path / "data.gz"
+    with gzip.open(gz, "wb") as f:
+        f.write(b"gzip data")
+    text = tmp_path / "notes.txt"
+    text.write_bytes(b"just some text, not an archive")
+
+    assert detect_archive_format(_make_zip(tmp_path / "a.zip")) == "zip"
+    assert detect_archive_format(_make_tar(tmp_path / "a.tar")) == "tar"
+    assert detect_archive_format(gz) == "gzip"
+    assert detect_archive_format(text) is None
+
+
+def test_detect_format_sniffs_zip_without_extension(tmp_path):
+    archive = _make_zip(tmp_path / "archive.bin")
+    assert cli._detect_format(archive) == "zip"
+    assert cli._detect_format(_make_zip(tmp_path / "archive.zip")) == "zip"
+
+
+def test_detect_format_sees_replaced_file(tmp_path):
+    path = tmp_path / "archive.bin"
+    _make_zip(path)
+    assert cli._detect_format(path) == "zip"
+
+    # A different file at the same path (new size and mtime) is sniffed again
+    _make_tar(tmp_path / "replacement.tar")
+    os.replace(tmp_path / "replacement.tar", path)
+    assert cli._detect_format(path) == "tar"
+
+
+@pytest.mark.parametrize("copies", [1, _PARALLEL_DETECT_MIN_PATHS])
+def test_detect_archive_formats(tmp_path, capsys, copies):
+    expected = {}
+    for i in range(copies):
+        expected[_make_zip(tmp_path / f"a{i}.zip")] = "zip"
+        expected[_make_tar(tmp_path / f"t{i}.tar")] = "tar"
+        text = tmp_path / f"n{i}.txt"
+        text.write_bytes(b"not an archive")
+        expected[text] = None
+    missing = tmp_path / "missing.zip"
+    expected[missing] = None
+    assert (len(expected) >= _PARALLEL_DETECT_MIN_PATHS) == (copies > 1)
+
+    assert detect_archive_formats(list(expected)) == expected
+    # Unrecognized files are not logged one by one
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("trust", [False, True])
+def test_trust_extension_agrees_with_sniffing(tmp_path, monkeypatch, trust):
+    monkeypatch.setattr(cli, "_trust_extension", trust)
+    tgz = tmp_path / "archive.tgz"
+    with tarfile.open(tgz, "w:gz") as tar:
+        member = tmp_path / "member.txt"
+        member.write_bytes(b"member")
+        tar.add(member, arcname="member.txt")
+
+    assert cli._detect_format(tgz) == "gzip"
+    assert cli._detect_format(_make_zip(tmp_path / "a.zip")) == "zip"
@@ -0,0 +1,209 @@
+"""Tests for the CLI's parallel, positional-read extraction path."""
+
+import functools
+import os
+import struct
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import dnzip.__main__ as cli
+from dnzip import ZipReader, ZipWriter
+from dnzip.errors import ZipCrcError
+
+DATA = os.urandom(1000) + b"extract me " * 20000
+
+COMPRESSIONS = ["stored", "deflate"]
+try:
+    import zstandard  # noqa: F401
+except ImportError:
+    pass
+else:
+    COMPRESSIONS.append("zstd")
+
+
+def _make_archive(path, compression):
+    with ZipWriter(path) as writer:
+        writer.add_bytes("dir/data.bin", DATA, compression=compression)
+        writer.add_bytes("empty.txt", b"", compression=compression)
+    return path
+
+
+@pytest.mark.parametrize("verify_crc", [True, False])
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_extract_entry_pread_round_trip(tmp_path, compression, verify_crc):
+    archive = _make_archive(tmp_path / "a.zip", compression)
+    with ZipReader(archive) as reader:
+        entries = [(info, reader.get_data_offset(info.name)) for info in reader.iter_infos()]
+
+    fd = os.open(archive, os.O_RDONLY)
+    try:
+        for info, data_offset in entries:
+            target = tmp_path / info.name.replace("/", "_")
+            cli._extract_entry_pread(fd, info, data_offset, target, verify_crc)
+            assert target.read_bytes() == (DATA if info.name == "dir/data.bin" else b"")
+    finally:
+        os.close(fd)
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_extract_entry_pread_detects_crc_mismatch(tmp_path, compression):
+    archive = _make_archive(tmp_path / "a.zip", compression)
+    with ZipReader(archive) as reader:
+        info = reader.get_info("dir/data.bin")
+        data_offset = reader.get_data_offset(info.name)
+    bad_info = SimpleNamespace(
+        name=info.name,
+        compression_method=info.compression_method,
+        compressed_size=info.compressed_size,
+        uncompressed_size=info.uncompressed_size,
+        crc32=info.crc32 ^ 1,
+    )
+
+    fd = os.open(archive, os.O_RDONLY)
+    try:
+        with pytest.raises(ZipCrcError):
+            cli._extract_entry_pread(fd, bad_info, data_offset, tmp_path / "out.bin")
+    finally:
+        os.close(fd)
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_extract_parallel_round_trip(tmp_path, compression, capsys):
+    archive = _make_archive(tmp_path / "a.zip", compression)
+    output = tmp_path / "out"
+    output.mkdir()
+
+    cli._extract_parallel(archive, output, jobs=4)
+
+    assert (output / "dir" / "data.bin").read_bytes() == DATA
+    assert (output / "empty.txt").read_bytes() == b""
+    # Progress goes to stderr; entries are reported in archive order
+    assert capsys.readouterr().err.rstrip().endswith("[2/2] empty.txt 100%")
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_extract_parallel_streams_large_entries(tmp_path, monkeypatch, compression):
+    # Shrink the one-shot limit and the copy buffers so DATA counts as a large
+    # entry and is streamed in several chunks
+    monkeypatch.setattr(cli, "_PARALLEL_EXTRACT_MAX_ENTRY_SIZE", 64 * 1024)
+    monkeypatch.setattr(cli, "_EXTRACT_CHUNK_SIZE", 16 * 1024)
+    monkeypatch.setattr(cli, "_BackgroundWriter", functools.partial(cli._BackgroundWriter, buffer_size=16 * 1024))
+    streamed = []
+    stream_entry = cli._stream_entry_pread
+
+    def spy(writer, fd, info, *args):
+        streamed.append(info.name)
+        stream_entry(writer, fd, info, *args)
+
+    monkeypatch.setattr(cli, "_stream_entry_pread", spy)
+
+    archive = tmp_path / "a.zip"
+    with ZipWriter(archive) as writer:
+        writer.add_bytes("small.txt", b"small entry\n", compression=compression)
+        writer.add_bytes("big.bin", DATA, compression=compression)
+    output = tmp_path / "out"
+    output.mkdir()
+
+    cli._extract_parallel(archive, output, jobs=4)
+
+    assert (output / "small.txt").read_bytes() == b"small entry\n"
+    assert (output / "big.bin").read_bytes() == DATA
+    # Stored entries are always copied chunk by chunk by the pool
+    assert streamed == ([] if compression == "stored" else ["big.bin"])
+
+
+def _corrupt_central_crc(path, name):
+    """Flip the CRC32 recorded for *name* in the central directory of *path*."""
+    data = bytearray(path.read_bytes())
+    pos = data.find(b"PK\x01\x02")
+    while pos != -1:
+        name_len = struct.unpack_from("<H", data, pos + 28)[0]
+        if data[pos + 46:pos + 46 + name_len] == name.encode():
+            data[pos + 16] ^= 0xFF
+            path.write_bytes(bytes(data))
+            return
+        pos = data.find(b"PK\x01\x02", pos + 46)
+    raise AssertionError(f"{name} not in central directory")
+
+
+@pytest.mark.parametrize("bad", ["small-bad.txt", "big-bad.bin"])
+def test_extract_crc_failure_keeps_other_entries(tmp_path, monkeypatch, capsys, bad):
+    monkeypatch.setattr(cli, "_PARALLEL_EXTRACT_MAX_ENTRY_SIZE", 64 * 1024)
+    archive = tmp_path / "a.zip"
+    entries = {
+        "a.txt": b"first\n",
+        "small-bad.txt": b"corrupt me\n",
+        "big-bad.bin": DATA,
+        "big-good.bin": DATA[::-1],
+        "z.txt": b"last\n",
+    }
+    with ZipWriter(archive) as writer:
+        for name, data in entries.items():
+            writer.add_bytes(name, data, compression="deflate")
+    _corrupt_central_crc(archive, bad)
+    output = tmp_path / "out"
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli._cmd_extract(archive, output, quiet=True, jobs=4)
+
+    assert exc_info.value.code == 1
+    assert f"CRC32 mismatch for '{bad}'" in capsys.readouterr().err
+    assert not (output / bad).exists()
+    for name, data in entries.items():
+        if name != bad:
+            assert (output / name).read_bytes() == data
+
+
+def test_background_writer_round_trip(tmp_path):
+    target = tmp_path / "out.bin"
+    writer = cli._BackgroundWriter(max_buffers=2, buffer_size=4096)
+    with open(tmp_path / "src.bin", "wb") as src:
+        src.write(DATA)
+    with open(tmp_path / "src.bin", "rb") as src:
+        cli._write_entry_in_background(writer, src, target, mode=0o640)
+    writer.finish()
+
+    assert target.read_bytes() == DATA
+    assert target.stat().st_mode & 0o777 == 0o640
+
+
+def test_background_writer_reports_write_errors(tmp_path):
+    path = tmp_path / "read-only.bin"
+    path.write_bytes(b"")
+    writer = cli._BackgroundWriter(max_buffers=1, buffer_size=16)
+    fd = os.open(path, os.O_RDONLY)
+
+    buffer = writer.get_buffer()
+    writer.write(fd, buffer, 16)
+    # The failed write still returns its buffer, so the producer is not stuck
+    assert writer.get_buffer() is buffer
+    writer.release(buffer)
+    writer.close_file(fd)
+    with pytest.raises(OSError):
+        writer.finish()
+    with pytest.raises(OSError):
+        os.fstat(fd)  # closed by the writer thread despite the error
+
+
+def test_background_writer_stopped_thread_does_not_block(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "_BACKGROUND_WRITER_POLL_INTERVAL", 0.01)
+    writer = cli._BackgroundWriter(max_buffers=1, buffer_size=16)
+    writer.get_buffer()
+    writer._pending.put(None)
+    writer._thread.join()
+
+    errors = []
+
+    def wait_for_buffer():
+        try:
+            writer.get_buffer()
+        except RuntimeError as e:
+            errors.append(e)
+
+    waiter = threading.Thread(target=wait_for_buffer, daemon=True)
+    waiter.start()
+    waiter.join(timeout=5)
+    assert not waiter.is_alive()
+    assert len(errors) == 1 and "stopped" in str(errors[0])
@@ -0,0 +1,78 @@
+"""Tests for merge_archives()."""
+
+from dnzip import ZipReader, ZipWriter
+from dnzip.constants import COMP_STORED
+from dnzip.utils import merge_archives
+
+
+def _read_all(path):
+    with ZipReader(path) as reader:
+        return {name: reader.open(name).read() for name in reader.list()}
+
+
+def _raw_entry(path, name):
+    with ZipReader(path) as reader:
+        info = reader.get_info(name)
+        offset = reader.get_data_offset(name)
+    with open(path, "rb") as f:
+        f.seek(offset)
+        compressed = f.read(info.compressed_size)
+    return info.compression_method, info.crc32, info.uncompressed_size, compressed
+
+
+def test_merge_keeps_zero_byte_entries(tmp_path):
+    source = tmp_path / "a.zip"
+    with ZipWriter(source) as writer:
+        writer.add_bytes("empty.bin", b"")
+        writer.add_bytes("data.txt", b"hello " * 1000)
+
+    output = tmp_path / "merged.zip"
+    result = merge_archives(output, [source])
+
+    assert result["entries_added"] == 2
+    assert result["entries_failed"] == 0
+    assert result["errors"] == []
+    assert _read_all(output) == {"empty.bin": b"", "data.txt": b"hello " * 1000}
+    with ZipReader(output) as reader:
+        info = reader.get_info("empty.bin")
+        assert info.compression_method == COMP_STORED
+        assert info.compressed_size == 0
+
+
+def test_merge_copies_compressed_data_verbatim(tmp_path):
+    data = b"raw copy " * 5000
+    source = tmp_path / "a.zip"
+    with ZipWriter(source) as writer:
+        writer.add_bytes("data.txt", data, compression="deflate", compression_level=9)
+        writer.add_bytes("stored.bin", data[:100], compression="stored")
+
+    output = tmp_path / "merged.zip"
+    result = merge_archives(output, [source])
+
+    assert result["entries_added"] == 2
+    assert _read_all(output) == {"data.txt": data, "stored.bin": data[:100]}
+    # The merged entry reuses the source's compressed bytes and metadata
+    assert _raw_entry(output, "data.txt") == _raw_entry(source, "data.txt")
+    assert _raw_entry(output, "stored.bin") == _raw_entry(source, "stored.bin")
+
+
+def test_merge_records_entry_errors(tmp_path):
+    source = tmp_path / "a.zip"
+    with ZipWriter(source) as writer:
+        writer.add_bytes("good.txt", b"good")
+        writer.add_bytes("bad.txt", b"bad")
+
+    class FailingWriter(ZipWriter):
+        def add_precompressed(self, name, *args, **kwargs):
+            if name == "bad.txt":
+                raise OSError("disk full")
+            return super().add_precompressed(name, *args, **kwargs)
+
+    output = tmp_path / "merged.zip"
+    result = merge_archives(output, [source], writer_class=FailingWriter)
+
+    assert result["entries_added"] == 1
+    assert result["entries_failed"] == 1
+    assert len(result["errors"]) == 1
+    assert "bad.txt" in result["errors"][0] and "disk full" in result["errors"][0]
+    assert _read_all(output) == {"good.txt": b"good"}
@@ -0,0 +1,62 @@
+"""Tests for safe_extract_path() with a pre-resolved target directory."""
+
+import os
+
+import pytest
+
+from dnzip.errors import ZipFormatError
+from dnzip.utils import safe_extract_path
+
+
+def _check(target, name, verified_dirs=None):
+    return safe_extract_path(
+        target, name,
+        resolved_target_dir=str(target.resolve()),
+        verified_dirs=verified_dirs,
+    )
+
+
+def test_resolved_target_dir_accepts_plain_entries(tmp_path):
+    target = tmp_path / "out"
+    (target / "sub").mkdir(parents=True)
+    verified = set()
+
+    assert _check(target, "sub/file.txt", verified) == target.resolve() / "sub" / "file.txt"
+    assert _check(target, "new/dir/file.txt", verified) == target.resolve() / "new" / "dir" / "file.txt"
+    assert str(target.resolve() / "sub") in verified
+
+
+@pytest.mark.parametrize("name", ["../evil", "a/../../evil", "C:/evil"])
+def test_resolved_target_dir_rejects_traversal(tmp_path, name):
+    target = tmp_path / "out"
+    target.mkdir()
+    with pytest.raises(ZipFormatError):
+        _check(target, name)
+
+
+def test_resolved_target_dir_follows_existing_directory_symlink(tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    target = tmp_path / "out"
+    target.mkdir()
+    os.symlink(outside, target / "link")
+
+    for verified in (None, set()):
+        with pytest.raises(ZipFormatError, match="outside target directory"):
+            _check(target, "link/evil", verified)
+        with pytest.raises(ZipFormatError, match="outside target directory"):
+            _check(target, "link/deeper/evil", verified)
+
+
+def test_resolved_target_dir_follows_existing_file_symlink(tmp_path):
+    outside = tmp_path / "victim.txt"
+    outside.write_text("keep")
+    target = tmp_path / "out"
+    target.mkdir()
+    os.symlink(outside, target / "file.txt")
+    os.symlink(target / "real.txt", target / "inner.txt")
+
+    with pytest.raises(ZipFormatError, match="outside target directory"):
+        _check(target, "file.txt", set())
+    # A symlink that stays inside the target directory is fine
+    assert _check(target, "inner.txt", set()) == target.resolve() / "inner.txt"
@@ -0,0 +1,73 @@
+"""Tests for ZipWriter's streaming and file entry paths."""
+
+import io
+import struct
+
+from dnzip import StreamingZipWriter, ZipReader, ZipWriter
+from dnzip.constants import FLAG_DATA_DESCRIPTOR
+from dnzip.utils import crc32
+from dnzip.writer import ONE_SHOT_DEFLATE_MAX_SIZE
+
+LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+DATA_DESCRIPTOR_SIGNATURE = 0x08074B50
+ZIP64_EXTRA_FIELD = struct.Struct("<HHQQ")
+
+
+def _local_header(archive_bytes, offset):
+    fields = LOCAL_HEADER.unpack_from(archive_bytes, offset)
+    name_len, extra_len = fields[9], fields[10]
+    extra_start = offset + LOCAL_HEADER.size + name_len
+    return fields, archive_bytes[extra_start:extra_start + extra_len]
+
+
+def test_add_stream_writes_data_descriptor(tmp_path):
+    data = b"streamed line\n" * 50000
+    archive = tmp_path / "stream.zip"
+    with StreamingZipWriter(archive) as writer:
+        writer.add_stream("stream.txt", io.BytesIO(data))
+        writer.add_stream("stored.bin", io.BytesIO(data[:1000]), compression="stored")
+
+    with ZipReader(archive) as reader:
+        assert reader.open("stream.txt").read() == data
+        assert reader.open("stored.bin").read() == data[:1000]
+        info = reader.get_info("stream.txt")
+        data_offset = reader.get_data_offset("stream.txt")
+
+    assert info.flags & FLAG_DATA_DESCRIPTOR
+    archive_bytes = archive.read_bytes()
+    fields, _ = _local_header(archive_bytes, 0)
+    # CRC32 and sizes are zero in the local header ...
+    assert fields[6:9] == (0, 0, 0)
+    # ... and follow the data in the descriptor
+    signature, crc, compressed_size, uncompressed_size = struct.unpack_from(
+        "<IIII", archive_bytes, data_offset + info.compressed_size
+    )
+    assert signature == DATA_DESCRIPTOR_SIGNATURE
+    assert (crc, compressed_size, uncompressed_size) == (crc32(data), info.compressed_size, len(data))
+
+
+def test_add_file_patches_zip64_local_header(tmp_path):
+    # Above ONE_SHOT_DEFLATE_MAX_SIZE, add_file always streams and patches the header
+    data = b"0123456789abcdef" * ((ONE_SHOT_DEFLATE_MAX_SIZE + (1 << 20)) // 16)
+    source = tmp_path / "large.bin"
+    source.write_bytes(data)
+
+    class Zip64Writer(ZipWriter):
+        # Entries this large cannot be produced in a test, so force the ZIP64 layout
+        def _needs_zip64_for_entry(self, entry_info):
+            return True
+
+    archive = tmp_path / "large.zip"
+    with Zip64Writer(archive) as writer:
+        writer.add_file("large.bin", str(source), compression="deflate", compression_level=1)
+
+    with ZipReader(archive) as reader:
+        info = reader.get_info("large.bin")
+        assert reader.open("large.bin").read() == data
+
+    fields, extra = _local_header(archive.read_bytes(), 0)
+    assert fields[6:9] == (crc32(data), 0xFFFFFFFF, 0xFFFFFFFF)
+    tag, size, uncompressed_size, compressed_size = ZIP64_EXTRA_FIELD.unpack_from(extra)
+    assert tag == 0x0001
+    assert (uncompressed_size, compressed_size) == (len(data), info.compressed_size)
+    assert compressed_size < len(data)
@@ -0,0 +1,41 @@
+"""Tests for Zstandard (ZIP method 93) entries."""
+
+import io
+import os
+
+import pytest
+
+zstandard = pytest.importorskip("zstandard")
+
+from dnzip import ZipReader, ZipWriter
+from dnzip.constants import COMP_ZSTD
+from dnzip.errors import ZipCompressionError
+
+DATA = os.urandom(4096) + b"zstd " * 100000
+
+
+def test_zstd_round_trip(tmp_path):
+    archive = tmp_path / "z.zip"
+    source = tmp_path / "source.bin"
+    source.write_bytes(DATA)
+    with ZipWriter(archive) as writer:
+        writer.add_bytes("bytes.bin", DATA, compression="zstd", compression_level=3)
+        writer.add_file("file.bin", str(source), compression="zstd", compression_level=3)
+
+    with ZipReader(archive) as reader:
+        for name in ("bytes.bin", "file.bin"):
+            assert reader.get_info(name).compression_method == COMP_ZSTD
+            assert reader.open(name).read() == DATA
+
+
+def test_zstd_stream_errors_are_wrapped(tmp_path):
+    class FailingCompressor:
+        def compress(self, data):
+            raise zstandard.ZstdError("boom")
+
+        def flush(self):
+            return b""
+
+    with ZipWriter(tmp_path / "e.zip") as writer:
+        with pytest.raises(ZipCompressionError, match="Zstandard compression failed"):
+            writer._stream_entry_data(io.BytesIO(b"x" * 10), FailingCompressor())